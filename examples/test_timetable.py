@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 """Test script for ClassCharts API authentication and timetable fetching."""
 
-import argparse
 import sys
-from datetime import datetime, timedelta
+import traceback
+from datetime import datetime
 
 from pyclasscharts import ParentClient, StudentClient
 from pyclasscharts.exceptions import AuthenticationError, ValidationError
 
 
-def test_parent_auth(email: str, password: str, date: str | None = None) -> None:
+def test_parent_auth(email: str, password: str, date: str) -> None:
     """Test parent authentication and fetch timetable."""
     print("=" * 60)
     print("Testing Parent Client Authentication")
@@ -39,8 +39,6 @@ def test_parent_auth(email: str, password: str, date: str | None = None) -> None
             print(f"✓ Student info retrieved: {student_info['data']['user']['name']}")
 
             # Get timetable
-            if date is None:
-                date = datetime.now().strftime("%Y-%m-%d")
             print(f"\nFetching timetable for: {date}")
             lessons = client.get_lessons(options={"date": date})
 
@@ -54,12 +52,11 @@ def test_parent_auth(email: str, password: str, date: str | None = None) -> None
         sys.exit(1)
     except Exception as e:
         print(f"✗ Unexpected Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
-def test_student_auth(student_code: str, date_of_birth: str, date: str | None = None) -> None:
+def test_student_auth(student_code: str, date_of_birth: str, date: str) -> None:
     """Test student authentication and fetch timetable."""
     print("=" * 60)
     print("Testing Student Client Authentication")
@@ -78,8 +75,6 @@ def test_student_auth(student_code: str, date_of_birth: str, date: str | None =
         print(f"✓ Student info retrieved: {student_info['data']['user']['name']}")
 
         # Get timetable
-        if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
         print(f"\nFetching timetable for: {date}")
         lessons = client.get_lessons(options={"date": date})
 
@@ -93,7 +88,6 @@ def test_student_auth(student_code: str, date_of_birth: str, date: str | None =
         sys.exit(1)
     except Exception as e:
         print(f"✗ Unexpected Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -145,6 +139,9 @@ def print_timetable(lessons: dict, date: str) -> None:
 
 def main() -> None:
     """Main entry point."""
+    # Only needed when run as a script, so keep it out of module import time
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Test ClassCharts API authentication and fetch timetable"
     )
@@ -178,12 +175,13 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    date = args.date or datetime.now().strftime("%Y-%m-%d")
 
     if args.type == "parent":
         if not args.email or not args.password:
             print("Error: --email and --password are required for parent authentication", file=sys.stderr)
             sys.exit(1)
-        test_parent_auth(args.email, args.password, args.date)
+        test_parent_auth(args.email, args.password, date)
     elif args.type == "student":
         if not args.student_code or not args.date_of_birth:
             print(
@@ -191,7 +189,7 @@ def main() -> None:
                 file=sys.stderr,
             )
             sys.exit(1)
-        test_student_auth(args.student_code, args.date_of_birth, args.date)
+        test_student_auth(args.student_code, args.date_of_birth, date)
 
     print("\n" + "=" * 60)
     print("✓ Test completed successfully!")
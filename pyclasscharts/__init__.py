@@ -1,7 +1,23 @@
 """ClassCharts API client library for Python."""
 
+import typing as _typing
+
 from pyclasscharts.parent_client import ParentClient
 from pyclasscharts.student_client import StudentClient
 
 __version__ = "0.1.0"
+# Only the sync clients, so star imports work without aiohttp installed
 __all__ = ["ParentClient", "StudentClient"]
+
+
+def __getattr__(name: str) -> _typing.Any:
+    # The async clients need the optional aiohttp dependency, so only import them on request
+    if name == "AsyncParentClient":
+        from pyclasscharts.async_parent_client import AsyncParentClient
+
+        return AsyncParentClient
+    if name == "AsyncStudentClient":
+        from pyclasscharts.async_student_client import AsyncStudentClient
+
+        return AsyncStudentClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,77 @@
+"""In-process cache with a time to live per entry."""
+
+import heapq
+import time
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Mapping of keys to values that expire after their own time to live.
+
+    Expired entries are dropped when read, and a heap of expiry times lets puts
+    purge everything that has expired without scanning the whole cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[K, Tuple[float, V]] = {}
+        self._expiries: List[Tuple[float, int, K]] = []
+        self._counter = 0  # Tie-breaker so the heap never compares keys
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, now: Optional[float] = None) -> Optional[V]:
+        """
+        Get a value if it hasn't expired.
+
+        Args:
+            key: Cache key
+            now: Current time.monotonic(), looked up if not given
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= (time.monotonic() if now is None else now):
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def put(self, key: K, value: V, ttl: float, now: Optional[float] = None) -> None:
+        """
+        Store a value for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the value expires
+            now: Current time.monotonic(), looked up if not given
+        """
+        if now is None:
+            now = time.monotonic()
+        self._purge(now)
+        expires_at = now + ttl
+        self._entries[key] = (expires_at, value)
+        self._counter += 1
+        heapq.heappush(self._expiries, (expires_at, self._counter, key))
+
+    def _purge(self, now: float) -> None:
+        expiries = self._expiries
+        entries = self._entries
+        while expiries and expiries[0][0] <= now:
+            expires_at, _, key = heapq.heappop(expiries)
+            # The key may have been overwritten with a later expiry since
+            entry = entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._expiries.clear()
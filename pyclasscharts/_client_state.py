@@ -0,0 +1,259 @@
+"""Session and response cache state shared by the sync and asyncio clients."""
+
+import math
+from abc import ABC
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from pyclasscharts._cache import TTLCache
+from pyclasscharts.consts import ERROR_BODY_LIMIT, ETAG_CACHE_SIZE, PING_INTERVAL_SECONDS
+from pyclasscharts.exceptions import APIError
+from pyclasscharts.session_cache import SessionCache
+from pyclasscharts.utils import json_loads
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+ETagEntry = Tuple[str, bytes]
+
+# The /ping body is the same on every call, so it is form-encoded once up front
+_PING_BODY = "include_data=true"
+_PING_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Option keys accepted by the get_* methods, mapped to their API query parameter names
+_QUERY_PARAMS = {
+    "display_date": "display_date",
+    "from_date": "from",
+    "last_id": "last_id",
+    "to_date": "to",
+}
+
+
+def _build_query(options: Optional[Mapping[str, Any]], *allowed: str) -> Dict[str, Any]:
+    """Translate get_* options into API query parameters, keeping only the allowed keys."""
+    if not options:
+        return {}
+    return {_QUERY_PARAMS[key]: options[key] for key in allowed if key in options}
+
+
+def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+    """Build the response cache key for a GET request."""
+    return (path, tuple(sorted(params.items())) if params else ())
+
+
+class ClientStateMixin(ABC):
+    """
+    Session, endpoint and response cache state shared by BaseClient and AsyncBaseClient.
+
+    The clients differ only in how requests are sent; everything done before a request
+    goes out and after its body has been read lives here.
+    """
+
+    __slots__ = (
+        "_api_base",
+        "_authed_headers",
+        "_cache",
+        "_cache_ttl",
+        "_endpoints",
+        "_etags",
+        "_last_ping",
+        "_revalidate_at",
+        "_session_cache",
+        "_session_id",
+        "_student_id",
+    )
+
+    # Per-student API routes, pre-formatted into _endpoints whenever student_id changes
+    _student_routes: Tuple[str, ...] = (
+        "activity",
+        "announcements",
+        "attendance",
+        "behaviour",
+        "customfields",
+        "detentions",
+        "eventbadges",
+        "homeworks",
+        "timetable",
+    )
+
+    def __init__(self, api_base: str, session_cache: Optional[SessionCache] = None) -> None:
+        """
+        Initialise the client state for the given API URL.
+
+        Args:
+            api_base: Base API URL, different for parent vs student
+            session_cache: Optional on-disk cache used to resume sessions across processes
+        """
+        self._api_base = api_base
+        self._session_cache = session_cache
+        self.student_id = 0
+        self._session_id = ""
+        self._authed_headers: Mapping[str, str] = MappingProxyType({})
+        self._rebuild_authed_headers()
+        self.last_ping = 0.0
+        # Response bodies are cached rather than parsed responses, so every call gets
+        # its own objects and callers can't change what later calls see
+        self._cache: TTLCache[CacheKey, bytes] = TTLCache()
+        self._cache_ttl = 60.0
+        # ETags of recent GET responses, with the response body, most recent last
+        self._etags: OrderedDict[CacheKey, ETagEntry] = OrderedDict()
+
+    @property
+    def student_id(self) -> int:
+        """The ID of the student that API requests are made for."""
+        return self._student_id
+
+    @student_id.setter
+    def student_id(self, value: int) -> None:
+        self._student_id = value
+        self._endpoints = {
+            route: f"{self._api_base}/{route}/{value}" for route in self._student_routes
+        }
+
+    @property
+    def last_ping(self) -> float:
+        """time.monotonic() of the last ping, or 0 if the session has never been pinged."""
+        return self._last_ping
+
+    @last_ping.setter
+    def last_ping(self, value: float) -> None:
+        self._last_ping = value
+        # Precompute when the session next needs revalidating, so requests only compare
+        self._revalidate_at = value + PING_INTERVAL_SECONDS if value else math.inf
+
+    @property
+    def session_id(self) -> str:
+        """The current session ID, sent with every authenticated request."""
+        return self._session_id
+
+    @session_id.setter
+    def session_id(self, value: str) -> None:
+        # Cached responses belong to the session they were fetched with
+        if value != self._session_id:
+            self._cache.clear()
+        self._session_id = value
+        self._rebuild_authed_headers()
+
+    def _rebuild_authed_headers(self) -> None:
+        """
+        Pre-format the authentication headers so requests don't rebuild them each call.
+
+        Cookies are not included: the HTTP session's cookie jar sends them automatically.
+        """
+        self._authed_headers = MappingProxyType({"Authorization": f"Basic {self._session_id}"})
+
+    @property
+    def cache_ttl(self) -> float:
+        """How long, in seconds, GET responses are cached for. 0 disables caching."""
+        return self._cache_ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, value: float) -> None:
+        self._cache_ttl = float(value)
+        self._cache.clear()
+
+    def invalidate_cache(self) -> None:
+        """Discard all cached GET responses."""
+        self._cache.clear()
+        self._etags.clear()
+
+    def _lookup_cache(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[CacheKey], Optional[Dict[str, Any]], Optional[ETagEntry]]:
+        """
+        Look up a request in the response cache and the ETags of earlier responses.
+
+        Returns:
+            The cache key, the cached response if still fresh, and the ETag entry if
+            any; all None for requests other than GETs
+        """
+        if method != "GET":
+            return None, None, None
+        cache_key = _cache_key(path, params)
+        if self._cache_ttl > 0:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cache_key, json_loads(cached), None
+        return cache_key, None, self._etags.get(cache_key)
+
+    def _request_headers(
+        self, headers: Optional[Dict[str, str]], etag_entry: Optional[ETagEntry]
+    ) -> Mapping[str, str]:
+        """Get the headers for a request: authentication, any extras, and If-None-Match."""
+        # The pre-formatted auth headers are read-only, so they are passed through as-is
+        # unless additional headers need merging in
+        request_headers: Mapping[str, str] = (
+            {**self._authed_headers, **headers} if headers else self._authed_headers
+        )
+        if etag_entry is not None:
+            request_headers = {**request_headers, "If-None-Match": etag_entry[0]}
+        return request_headers
+
+    def _handle_response(
+        self,
+        path: str,
+        status: int,
+        content: bytes,
+        etag: Optional[str],
+        cache_key: Optional[CacheKey],
+        etag_entry: Optional[ETagEntry],
+        cache_ttl: Optional[float],
+    ) -> Dict[str, Any]:
+        """
+        Decode a response that wasn't rate limited or an upstream error, caching GETs.
+
+        Raises:
+            APIError: If the response isn't JSON or reports an error
+        """
+        # Writes such as reward purchases change what GETs return; pings only read
+        if cache_key is None and path != f"{self._api_base}/ping":
+            self._cache.clear()
+
+        if status == 204:
+            return {}
+
+        if status == 304 and etag_entry is not None:
+            # Unchanged since it was last fetched, so reuse the earlier body
+            content = etag_entry[1]
+
+        # Decode the raw bytes directly: ClassCharts always sends UTF-8 JSON, so
+        # the HTTP libraries' charset detection is wasted work
+        try:
+            response_json: Dict[str, Any] = json_loads(content)
+        except ValueError as e:
+            text = content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+            raise APIError(f"Error parsing JSON. Returned response: {text}") from e
+
+        if response_json.get("success") == 0:
+            error_msg = response_json.get("error", "Unknown error")
+            raise APIError(error_msg)
+
+        if cache_key is not None:
+            self._store_response(cache_key, content, etag, cache_ttl)
+        return response_json
+
+    def _store_response(
+        self,
+        cache_key: CacheKey,
+        content: bytes,
+        etag: Optional[str],
+        cache_ttl: Optional[float],
+    ) -> None:
+        """Cache a successful GET response body, and remember its ETag for conditional GETs."""
+        if self._cache_ttl > 0:
+            self._cache.put(cache_key, content, self._cache_ttl if cache_ttl is None else cache_ttl)
+        if etag:
+            self._etags[cache_key] = (etag, content)
+            self._etags.move_to_end(cache_key)
+            if len(self._etags) > ETAG_CACHE_SIZE:
+                self._etags.popitem(last=False)
+
+    def _session_cache_account(self) -> str:
+        """Identifier of the account, used as the session cache key. Empty disables caching."""
+        return ""
+
+    def _session_cache_entry(self) -> Optional[Tuple[SessionCache, str]]:
+        """Get the session cache and account to save the current session under, if any."""
+        account = self._session_cache_account()
+        if self._session_cache is None or not account or not self.session_id:
+            return None
+        return self._session_cache, account
@@ -0,0 +1,536 @@
+"""Async base client for ClassCharts API."""
+
+import asyncio
+import time
+from abc import abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
+
+import aiohttp
+from yarl import URL
+
+from pyclasscharts._client_state import (
+    _PING_BODY,
+    _PING_HEADERS,
+    ClientStateMixin,
+    _build_query,
+)
+from pyclasscharts.consts import BASE_URL
+from pyclasscharts.exceptions import (
+    APIError,
+    ClassChartsError,
+    NoSessionError,
+    RateLimitError,
+)
+from pyclasscharts.ratelimit import BACKOFF_MAX_SECONDS, RateLimiter, backoff_delay, get_limiter
+from pyclasscharts.session_cache import SessionCache
+from pyclasscharts.types import (
+    ActivityPoint,
+    ActivityResponse,
+    AnnouncementsResponse,
+    AttendanceResponse,
+    BadgesResponse,
+    BehaviourResponse,
+    DetentionsResponse,
+    GetActivityOptions,
+    GetAttendanceOptions,
+    GetBehaviourOptions,
+    GetFullActivityOptions,
+    GetHomeworkOptions,
+    GetLessonsOptions,
+    GetStudentInfoResponse,
+    HomeworksResponse,
+    LessonsResponse,
+    PupilFieldsResponse,
+)
+
+
+class AsyncBaseClient(ClientStateMixin):
+    """
+    Shared asyncio client for both parent and student.
+
+    This is an abstract base class and should not be used directly. It mirrors
+    BaseClient, but every API call is a coroutine so independent requests can be
+    run concurrently with asyncio.gather().
+
+    Example:
+        >>> async with AsyncStudentClient("classchartsCode", "01/01/2000") as client:
+        ...     await client.login()
+        ...     lessons, homeworks = await asyncio.gather(
+        ...         client.get_lessons({"date": "2024-01-15"}),
+        ...         client.get_homeworks(),
+        ...     )
+    """
+
+    __slots__ = ("_rate_limiter", "_revalidate_lock", "_session")
+
+    # Number of times a rate limited request, or a GET that hit an upstream error, is retried
+    max_retries = 4
+
+    def __init__(self, api_base: str, session_cache: Optional[SessionCache] = None) -> None:
+        """
+        Create a new client with the given API URL.
+
+        Args:
+            api_base: Base API URL, different for parent vs student
+            session_cache: Optional on-disk cache used to resume sessions across processes
+        """
+        super().__init__(api_base, session_cache)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_limiter: RateLimiter = get_limiter(URL(api_base).raw_host or "")
+        # Created on first use, as locks are tied to an event loop on Python 3.9
+        self._revalidate_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the underlying aiohttp session, creating it on first use.
+
+        The session is created lazily because aiohttp requires a running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "User-Agent": "classcharts-api https://github.com/classchartsapi/classcharts-api-py"
+                },
+                connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    @abstractmethod
+    async def login(self) -> None:
+        """Authenticate with ClassCharts. Must be implemented by subclasses."""
+        pass
+
+    async def get_new_session_id(self) -> GetStudentInfoResponse:
+        """
+        Revalidate the session ID.
+
+        This is called automatically when the session ID is older than 3 minutes
+        and initially using the .login() method.
+
+        Returns:
+            The ping response, which also carries the current student's information
+        """
+        ping_data = await self._make_authed_request(
+            f"{self._api_base}/ping",
+            method="POST",
+            data=_PING_BODY,
+            headers=_PING_HEADERS,
+            revalidate_token=False,
+        )
+        self.session_id = ping_data["meta"]["session_id"]
+        self.last_ping = time.monotonic()
+        await self._save_session()
+        return cast(GetStudentInfoResponse, ping_data)
+
+    async def _revalidate_session(self) -> None:
+        """Ping to revalidate a stale session, once for all the requests waiting on it."""
+        if self._revalidate_lock is None:
+            self._revalidate_lock = asyncio.Lock()
+        async with self._revalidate_lock:
+            # Another request may have revalidated the session while this one waited
+            if time.monotonic() > self._revalidate_at:
+                await self.get_new_session_id()
+
+    async def _save_session(self) -> None:
+        """
+        Write the current session to the session cache, if one is configured.
+
+        The cache is on disk, so it is written from a worker thread rather than
+        blocking the event loop.
+        """
+        entry = self._session_cache_entry()
+        if entry is not None:
+            cookies = {cookie.key: cookie.value for cookie in self._get_session().cookie_jar}
+            await asyncio.to_thread(entry[0].set, entry[1], self.session_id, cookies)
+
+    async def _resume_cached_session(self) -> Optional[GetStudentInfoResponse]:
+        """
+        Resume a fresh session from the session cache, revalidating it with a ping.
+
+        Returns:
+            The validating ping response, or None if there was no usable cached session
+        """
+        account = self._session_cache_account()
+        if self._session_cache is None or not account:
+            return None
+        cached = await asyncio.to_thread(self._session_cache.get, account)
+        if cached is None:
+            return None
+
+        self._get_session().cookie_jar.update_cookies(cached["cookies"], URL(BASE_URL))
+        self.session_id = cached["session_id"]
+        try:
+            return await self.get_new_session_id()
+        except ClassChartsError:
+            await asyncio.to_thread(self._session_cache.delete, account)
+            self._get_session().cookie_jar.clear()
+            self.session_id = ""
+            return None
+
+    async def _make_authed_request(
+        self,
+        path: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        revalidate_token: bool = True,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the ClassCharts API with required authentication headers.
+
+        Successful GET responses are cached, keyed by path and params, until the session
+        changes or for cache_ttl seconds. After that, GETs of responses that came with an
+        ETag are made conditional, and a 304 reuses the previously fetched response.
+        Requests are paced by the host's shared RateLimiter.
+
+        Args:
+            path: Path to the API endpoint
+            method: HTTP method (GET, POST, etc.)
+            data: Form data to send (dict for form-encoded, str for raw body)
+            json_data: JSON data to send
+            params: URL parameters
+            headers: Additional headers to include in the request
+            revalidate_token: Whether to revalidate the session ID if it's older than 3 minutes
+            cache_ttl: Seconds to cache a GET response for, defaults to the client's cache_ttl
+
+        Returns:
+            Response JSON as a dictionary
+
+        Raises:
+            NoSessionError: If no session ID is available
+            RateLimitError: If the API still rate limits the request after max_retries, or
+                asks for a wait longer than BACKOFF_MAX_SECONDS
+            APIError: If the API returns an error response
+        """
+        if not self.session_id:
+            raise NoSessionError("No session ID")
+
+        cache_key, cached, etag_entry = self._lookup_cache(method, path, params)
+        if cached is not None:
+            return cached
+
+        # Revalidate token if needed
+        if revalidate_token and time.monotonic() > self._revalidate_at:
+            await self._revalidate_session()
+
+        request_headers = self._request_headers(headers, etag_entry)
+
+        # Make the request, backing off and retrying when rate limited or, for GETs,
+        # on upstream failures. POSTs such as purchases must not be repeated.
+        session = self._get_session()
+        attempt = 0
+        while True:
+            async with self._rate_limiter:
+                async with session.request(
+                    method,
+                    path,
+                    headers=request_headers,
+                    data=data,
+                    json=json_data,
+                    params=params,
+                ) as response:
+                    status = response.status
+                    retry_after = self._rate_limiter.update(response.headers)
+                    # Don't decode the error pages returned when rate limited or on
+                    # upstream failures
+                    if status != 429 and status < 500:
+                        content = await response.read() if status != 204 else b""
+                        etag = response.headers.get("ETag")
+                        break
+
+            # Give up rather than wait out a long Retry-After; the caller can decide
+            # whether to retry later
+            too_long = retry_after is not None and retry_after > BACKOFF_MAX_SECONDS
+            if too_long or attempt >= self.max_retries or (status != 429 and method != "GET"):
+                if status == 429:
+                    raise RateLimitError(retry_after)
+                raise APIError(f"Upstream error {status}")
+            await asyncio.sleep(backoff_delay(attempt, retry_after))
+            attempt += 1
+
+        return self._handle_response(path, status, content, etag, cache_key, etag_entry, cache_ttl)
+
+    async def get_student_info(self) -> GetStudentInfoResponse:
+        """
+        Get general information about the current student.
+
+        Returns:
+            Student information response
+        """
+        return cast(
+            GetStudentInfoResponse,
+            await self._make_authed_request(
+                f"{self._api_base}/ping",
+                method="POST",
+                data=_PING_BODY,
+                headers=_PING_HEADERS,
+            ),
+        )
+
+    async def get_activity(
+        self,
+        options: Optional[GetActivityOptions] = None,
+    ) -> ActivityResponse:
+        """
+        Get the current student's activity.
+
+        This function is only used for pagination. You likely want get_full_activity().
+
+        Args:
+            options: Options for getting activity data
+
+        Returns:
+            Activity data response
+
+        See Also:
+            get_full_activity: Gets all activity data between two dates
+        """
+        params = _build_query(options, "from_date", "to_date", "last_id")
+
+        return cast(
+            ActivityResponse,
+            await self._make_authed_request(
+                self._endpoints["activity"],
+                method="GET",
+                params=params,
+            ),
+        )
+
+    async def get_full_activity(
+        self,
+        options: GetFullActivityOptions,
+    ) -> List[ActivityPoint]:
+        """
+        Get the current student's activity between two dates.
+
+        This function will automatically paginate through all the data returned by get_activity().
+
+        Args:
+            options: Options for getting full activity data
+
+        Returns:
+            List of activity points
+
+        See Also:
+            get_activity: Gets a single page of activity data
+            iter_full_activity: Yields the activity points page by page instead
+        """
+        return [point async for point in self.iter_full_activity(options)]
+
+    async def iter_full_activity(
+        self,
+        options: GetFullActivityOptions,
+    ) -> AsyncIterator[ActivityPoint]:
+        """
+        Iterate over the current student's activity between two dates.
+
+        Pages are fetched from get_activity() as the iteration reaches them, so callers
+        that process points one at a time never hold the whole range in a single list.
+
+        Args:
+            options: Options for getting full activity data
+
+        Yields:
+            Activity points, oldest page first
+        """
+        params: GetActivityOptions = {
+            "from_date": options["from_date"],
+            "to_date": options["to_date"],
+        }
+        pending = asyncio.ensure_future(self.get_activity(params))
+
+        try:
+            while True:
+                fragment = (await pending)["data"]
+                if not fragment:
+                    return
+
+                # Request the next page before yielding this one, so the network wait
+                # overlaps with the caller's processing
+                params = {
+                    "from_date": options["from_date"],
+                    "to_date": options["to_date"],
+                    "last_id": str(fragment[-1]["id"]),
+                }
+                pending = asyncio.ensure_future(self.get_activity(params))
+                for point in fragment:
+                    yield point
+        finally:
+            # Don't leave a prefetch running if the caller stops iterating early
+            pending.cancel()
+
+    async def get_behaviour(
+        self,
+        options: Optional[GetBehaviourOptions] = None,
+    ) -> BehaviourResponse:
+        """
+        Get the current student's behaviour.
+
+        Args:
+            options: Options for getting behaviour data
+
+        Returns:
+            Behaviour response
+        """
+        params = _build_query(options, "from_date", "to_date")
+
+        return cast(
+            BehaviourResponse,
+            await self._make_authed_request(
+                self._endpoints["behaviour"],
+                method="GET",
+                params=params,
+            ),
+        )
+
+    async def get_homeworks(
+        self,
+        options: Optional[GetHomeworkOptions] = None,
+    ) -> HomeworksResponse:
+        """
+        Get the current student's homework.
+
+        Args:
+            options: Options for getting homework data
+
+        Returns:
+            Homeworks response
+        """
+        params = _build_query(options, "display_date", "from_date", "to_date")
+
+        return cast(
+            HomeworksResponse,
+            await self._make_authed_request(
+                self._endpoints["homeworks"],
+                method="GET",
+                params=params,
+            ),
+        )
+
+    async def get_lessons(
+        self,
+        options: GetLessonsOptions,
+    ) -> LessonsResponse:
+        """
+        Get the current student's lessons for a given date.
+
+        Args:
+            options: Options for getting lessons data (must include date)
+
+        Returns:
+            Lessons response
+
+        Raises:
+            ValueError: If no date is specified
+        """
+        if not options or "date" not in options:
+            raise ValueError("No date specified")
+
+        params = {"date": options["date"]}
+        return cast(
+            LessonsResponse,
+            await self._make_authed_request(
+                self._endpoints["timetable"],
+                method="GET",
+                params=params,
+            ),
+        )
+
+    async def get_badges(self) -> BadgesResponse:
+        """
+        Get the current student's earned badges.
+
+        Returns:
+            Badges response
+        """
+        return cast(
+            BadgesResponse,
+            await self._make_authed_request(
+                self._endpoints["eventbadges"],
+                method="GET",
+            ),
+        )
+
+    async def get_announcements(self) -> AnnouncementsResponse:
+        """
+        Get the current student's announcements.
+
+        Returns:
+            Announcements response
+        """
+        return cast(
+            AnnouncementsResponse,
+            await self._make_authed_request(
+                self._endpoints["announcements"],
+                method="GET",
+            ),
+        )
+
+    async def get_detentions(self) -> DetentionsResponse:
+        """
+        Get the current student's detentions.
+
+        Returns:
+            Detentions response
+        """
+        return cast(
+            DetentionsResponse,
+            await self._make_authed_request(
+                self._endpoints["detentions"],
+                method="GET",
+            ),
+        )
+
+    async def get_attendance(
+        self,
+        options: Optional[GetAttendanceOptions] = None,
+    ) -> AttendanceResponse:
+        """
+        Get the current student's attendance.
+
+        Args:
+            options: Options for getting attendance data
+
+        Returns:
+            Attendance response
+        """
+        params = _build_query(options, "from_date", "to_date")
+
+        return cast(
+            AttendanceResponse,
+            await self._make_authed_request(
+                self._endpoints["attendance"],
+                method="GET",
+                params=params,
+            ),
+        )
+
+    async def get_pupil_fields(self) -> PupilFieldsResponse:
+        """
+        Get the current student's pupil fields.
+
+        Returns:
+            Pupil fields response
+        """
+        return cast(
+            PupilFieldsResponse,
+            await self._make_authed_request(
+                self._endpoints["customfields"],
+                method="GET",
+            ),
+        )
@@ -0,0 +1,237 @@
+"""Async parent client for ClassCharts API."""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+from urllib.parse import unquote
+
+from pyclasscharts.async_base_client import AsyncBaseClient
+from pyclasscharts.consts import API_BASE_PARENT, BASE_URL, PUPILS_CACHE_TTL_SECONDS
+from pyclasscharts.exceptions import AuthenticationError, ValidationError
+from pyclasscharts.session_cache import SessionCache
+from pyclasscharts.types import ChangePasswordResponse, GetPupilsResponse, Pupil
+from pyclasscharts.utils import json_loads
+
+
+class AsyncParentClient(AsyncBaseClient):
+    """
+    Async Parent Client.
+
+    See AsyncBaseClient for all shared methods.
+
+    Example:
+        >>> from pyclasscharts import AsyncParentClient
+        >>> async with AsyncParentClient("username", "password") as client:
+        ...     await client.login()
+        ...     pupils = await client.get_pupils()
+    """
+
+    __slots__ = ("_pupils", "_pupils_by_id", "email", "password")
+
+    # Per-pupil routes fetched by fetch_all()
+    _fetch_all_routes: Tuple[str, ...] = (
+        "activity",
+        "attendance",
+        "behaviour",
+        "detentions",
+        "homeworks",
+    )
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        session_cache: Optional[SessionCache] = None,
+    ) -> None:
+        """
+        Initialize an async parent client.
+
+        Args:
+            email: Parent's email address
+            password: Parent's password
+            session_cache: Optional on-disk cache used to resume sessions across processes
+        """
+        super().__init__(API_BASE_PARENT, session_cache)
+        self.email = str(email)
+        self.password = str(password)
+        self._pupils: List[Pupil] = []
+        self._pupils_by_id: Dict[int, Pupil] = {}
+
+    @property
+    def pupils(self) -> List[Pupil]:
+        """Pupils connected to this parent's account, as fetched on login."""
+        return self._pupils
+
+    @pupils.setter
+    def pupils(self, value: List[Pupil]) -> None:
+        self._pupils = value
+        self._pupils_by_id = {pupil["id"]: pupil for pupil in value}
+
+    def _session_cache_account(self) -> str:
+        return self.email
+
+    async def login(self) -> None:
+        """
+        Authenticate with ClassCharts.
+
+        If the client has a session cache, a fresh cached session is resumed instead.
+
+        Raises:
+            ValidationError: If email or password is not provided
+            AuthenticationError: If authentication fails
+        """
+        if not self.email:
+            raise ValidationError("Email not provided")
+        if not self.password:
+            raise ValidationError("Password not provided")
+
+        if await self._resume_cached_session() is None:
+            await self._authenticate()
+            await self._save_session()
+
+        self.pupils = await self.get_pupils()
+        if not self.pupils:
+            raise ValidationError("Account has no pupils attached")
+
+        self.student_id = self.pupils[0]["id"]
+
+    async def _authenticate(self) -> None:
+        """Log in with the email and password to obtain a new session ID."""
+        form_data = {
+            "_method": "POST",
+            "email": self.email,
+            "logintype": "existing",
+            "password": self.password,
+            "recaptcha-token": "no-token-available",
+        }
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        async with self._get_session().post(
+            f"{BASE_URL}/parent/login",
+            data=form_data,
+            headers=headers,
+            allow_redirects=False,
+        ) as response:
+            if response.status != 302 or "set-cookie" not in response.headers:
+                raise AuthenticationError(
+                    "Unauthenticated: ClassCharts didn't return authentication cookies"
+                )
+            # aiohttp has already parsed the Set-Cookie headers (and stored them in the jar)
+            credentials_cookie = response.cookies.get("parent_session_credentials")
+
+        session_credentials = unquote(credentials_cookie.value) if credentials_cookie else ""
+
+        if not session_credentials:
+            raise AuthenticationError("Failed to extract session credentials")
+
+        try:
+            session_id_data = json_loads(session_credentials)
+            self.session_id = session_id_data["session_id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise AuthenticationError("Failed to parse session credentials") from e
+
+    async def get_pupils(self) -> GetPupilsResponse:
+        """
+        Get a list of pupils connected to this parent's account.
+
+        The list is cached until the session changes, for up to 3 minutes.
+
+        Returns:
+            A list of pupils connected to this parent's account
+        """
+        response = await self._make_authed_request(
+            f"{self._api_base}/pupils",
+            method="GET",
+            cache_ttl=PUPILS_CACHE_TTL_SECONDS,
+        )
+        return cast(GetPupilsResponse, response["data"])
+
+    def select_pupil(self, pupil_id: int) -> None:
+        """
+        Select a pupil to be used with API requests.
+
+        Args:
+            pupil_id: Pupil ID obtained from self.pupils or get_pupils()
+
+        Raises:
+            ValidationError: If no pupil ID is specified or pupil not found
+
+        See Also:
+            get_pupils: Get list of available pupils
+        """
+        if not pupil_id:
+            raise ValidationError("No pupil ID specified")
+
+        pupil = self._pupils_by_id.get(pupil_id)
+        if pupil is None:
+            raise ValidationError("No pupil with specified ID found")
+
+        self.student_id = pupil["id"]
+
+    async def fetch_all(
+        self,
+        pupil_ids: Optional[Iterable[int]] = None,
+        max_concurrency: int = 8,
+    ) -> Dict[Tuple[int, str], Union[Dict[str, Any], BaseException]]:
+        """
+        Fetch several pupils' activity, attendance, behaviour, detentions and homework at once.
+
+        The requests are run concurrently, at most max_concurrency at a time, using each
+        endpoint's default date range. The selected pupil is not changed.
+
+        Args:
+            pupil_ids: IDs of the pupils to fetch, defaults to all of self.pupils
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Responses keyed by (pupil ID, route), where route is one of "activity",
+            "attendance", "behaviour", "detentions" or "homeworks". A failed request maps
+            to the exception it raised instead.
+        """
+        if pupil_ids is None:
+            pupil_ids = list(self._pupils_by_id)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(pupil_id: int, route: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._make_authed_request(
+                    f"{self._api_base}/{route}/{pupil_id}", method="GET"
+                )
+
+        keys = [(pupil_id, route) for pupil_id in pupil_ids for route in self._fetch_all_routes]
+        results = await asyncio.gather(*(fetch(*key) for key in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    async def change_password(
+        self,
+        current_password: str,
+        new_password: str,
+    ) -> ChangePasswordResponse:
+        """
+        Change the login password for the current parent account.
+
+        Args:
+            current_password: Current password
+            new_password: New password
+
+        Returns:
+            Whether the request was successful
+        """
+        form_data = {
+            "current": current_password,
+            "new": new_password,
+            "repeat": new_password,
+        }
+        return cast(
+            ChangePasswordResponse,
+            await self._make_authed_request(
+                f"{self._api_base}/password",
+                method="POST",
+                data=form_data,
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+            ),
+        )
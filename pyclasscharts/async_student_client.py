@@ -0,0 +1,171 @@
+"""Async student client for ClassCharts API."""
+
+from typing import Optional, cast
+from urllib.parse import unquote
+
+from pyclasscharts.async_base_client import AsyncBaseClient
+from pyclasscharts.consts import API_BASE_STUDENT, BASE_URL
+from pyclasscharts.exceptions import AuthenticationError, ValidationError
+from pyclasscharts.session_cache import SessionCache
+from pyclasscharts.types import (
+    GetStudentCodeOptions,
+    GetStudentCodeResponse,
+    RewardPurchaseResponse,
+    RewardsResponse,
+)
+from pyclasscharts.utils import json_loads
+
+
+class AsyncStudentClient(AsyncBaseClient):
+    """
+    Async Student Client.
+
+    See AsyncBaseClient for all shared methods.
+
+    Example:
+        >>> from pyclasscharts import AsyncStudentClient
+        >>> # Date of birth MUST be in the format DD/MM/YYYY
+        >>> async with AsyncStudentClient("classchartsCode", "01/01/2000") as client:
+        ...     await client.login()
+    """
+
+    __slots__ = ("date_of_birth", "student_code")
+
+    _student_routes = AsyncBaseClient._student_routes + ("rewards",)
+
+    def __init__(
+        self,
+        student_code: str,
+        date_of_birth: str = "",
+        session_cache: Optional[SessionCache] = None,
+    ) -> None:
+        """
+        Initialize an async student client.
+
+        Args:
+            student_code: ClassCharts student code
+            date_of_birth: Student's date of birth (format: DD/MM/YYYY)
+            session_cache: Optional on-disk cache used to resume sessions across processes
+        """
+        super().__init__(API_BASE_STUDENT, session_cache)
+        self.student_code = str(student_code)
+        self.date_of_birth = str(date_of_birth)
+
+    def _session_cache_account(self) -> str:
+        return self.student_code.upper()
+
+    async def login(self) -> None:
+        """
+        Authenticate with ClassCharts.
+
+        If the client has a session cache, a fresh cached session is resumed instead.
+
+        Raises:
+            ValidationError: If student code is not provided
+            AuthenticationError: If authentication fails
+        """
+        if not self.student_code:
+            raise ValidationError("Student Code not provided")
+
+        ping_data = await self._resume_cached_session()
+        if ping_data is None:
+            await self._authenticate()
+            # The ping response already includes the student, so no separate info request
+            ping_data = await self.get_new_session_id()
+        self.student_id = ping_data["data"]["user"]["id"]
+
+    async def _authenticate(self) -> None:
+        """Log in with the student code and date of birth to obtain a new session ID."""
+        form_data = {
+            "_method": "POST",
+            "code": self.student_code.upper(),
+            "dob": self.date_of_birth,
+            "remember_me": "1",
+            "recaptcha-token": "no-token-available",
+        }
+
+        async with self._get_session().post(
+            f"{BASE_URL}/student/login",
+            data=form_data,
+            allow_redirects=False,
+        ) as response:
+            if response.status != 302 or "set-cookie" not in response.headers:
+                raise AuthenticationError(
+                    "Unauthenticated: ClassCharts didn't return authentication cookies"
+                )
+            # aiohttp has already parsed the Set-Cookie headers (and stored them in the jar)
+            credentials_cookie = response.cookies.get("student_session_credentials")
+
+        session_credentials = unquote(credentials_cookie.value) if credentials_cookie else ""
+
+        if not session_credentials:
+            raise AuthenticationError("Failed to extract session credentials")
+
+        try:
+            session_id_data = json_loads(session_credentials)
+            self.session_id = session_id_data["session_id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise AuthenticationError("Failed to parse session credentials") from e
+
+    async def get_rewards(self) -> RewardsResponse:
+        """
+        Get the available items in the current student's rewards shop.
+
+        Returns:
+            Array of purchasable items
+        """
+        return cast(
+            RewardsResponse,
+            await self._make_authed_request(
+                self._endpoints["rewards"],
+                method="GET",
+            ),
+        )
+
+    async def purchase_reward(self, item_id: int) -> RewardPurchaseResponse:
+        """
+        Purchase a reward item from the current student's rewards shop.
+
+        Args:
+            item_id: ID of the reward item to purchase
+
+        Returns:
+            An object containing the current student's balance and item ID purchased
+        """
+        body = f"pupil_id={self.student_id}"
+        return cast(
+            RewardPurchaseResponse,
+            await self._make_authed_request(
+                f"{self._api_base}/purchase/{item_id}",
+                method="POST",
+                data=body,
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+            ),
+        )
+
+    async def get_student_code(
+        self,
+        options: GetStudentCodeOptions,
+    ) -> GetStudentCodeResponse:
+        """
+        Get the current student's student code.
+
+        Args:
+            options: Options containing date_of_birth in format YYYY-MM-DD
+
+        Returns:
+            Response containing the student code
+        """
+        return cast(
+            GetStudentCodeResponse,
+            await self._make_authed_request(
+                f"{self._api_base}/getcode",
+                method="POST",
+                data=f"date={options['date_of_birth']}",
+                headers={
+                    "content-type": "application/x-www-form-urlencoded",
+                },
+            ),
+        )
@@ -1,14 +1,26 @@
 """Base client for ClassCharts API."""
 
-import json
 import time
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, cast
+from abc import abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Union, cast
 
 import requests
-
-from pyclasscharts.consts import PING_INTERVAL
-from pyclasscharts.exceptions import APIError, NoSessionError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pyclasscharts._client_state import (
+    _PING_BODY,
+    _PING_HEADERS,
+    ClientStateMixin,
+    _build_query,
+)
+from pyclasscharts.exceptions import (
+    APIError,
+    ClassChartsError,
+    NoSessionError,
+    RateLimitError,
+)
+from pyclasscharts.session_cache import SessionCache
 from pyclasscharts.types import (
     ActivityPoint,
     ActivityResponse,
@@ -28,53 +40,104 @@ from pyclasscharts.types import (
     LessonsResponse,
     PupilFieldsResponse,
 )
+from pyclasscharts.utils import parse_retry_after
 
 
-class BaseClient(ABC):
+class BaseClient(ClientStateMixin):
     """
     Shared client for both parent and student.
 
     This is an abstract base class and should not be used directly.
     """
 
-    def __init__(self, api_base: str) -> None:
+    __slots__ = ("_session",)
+
+    def __init__(self, api_base: str, session_cache: Optional[SessionCache] = None) -> None:
         """
         Create a new client with the given API URL.
 
         Args:
             api_base: Base API URL, different for parent vs student
+            session_cache: Optional on-disk cache used to resume sessions across processes
         """
-        self.student_id: int = 0
-        self.auth_cookies: List[str] = []
-        self.session_id: str = ""
-        self.last_ping: float = 0.0
-        self._api_base = api_base
+        super().__init__(api_base, session_cache)
         self._session = requests.Session()
         self._session.headers.update(
             {"User-Agent": "classcharts-api https://github.com/classchartsapi/classcharts-api-py"}
         )
+        # Only GETs are retried on upstream failures; POSTs such as purchases must not be
+        # repeated. Once retries run out the last response is returned so it maps to our
+        # errors. 429s are not retried and Retry-After is not slept on, so a rate limited
+        # call returns straight away with RateLimitError.retry_after for the caller.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        # Every request goes to the same host, so one pool with room for concurrency
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     @abstractmethod
     def login(self) -> None:
         """Authenticate with ClassCharts. Must be implemented by subclasses."""
         pass
 
-    def get_new_session_id(self) -> None:
+    def get_new_session_id(self) -> GetStudentInfoResponse:
         """
         Revalidate the session ID.
 
         This is called automatically when the session ID is older than 3 minutes
         and initially using the .login() method.
+
+        Returns:
+            The ping response, which also carries the current student's information
         """
-        form_data = {"include_data": "true"}
         ping_data = self._make_authed_request(
             f"{self._api_base}/ping",
             method="POST",
-            data=form_data,
+            data=_PING_BODY,
+            headers=_PING_HEADERS,
             revalidate_token=False,
         )
         self.session_id = ping_data["meta"]["session_id"]
-        self.last_ping = time.time() * 1000  # Convert to milliseconds
+        self.last_ping = time.monotonic()
+        self._save_session()
+        return cast(GetStudentInfoResponse, ping_data)
+
+    def _save_session(self) -> None:
+        """Write the current session to the session cache, if one is configured."""
+        entry = self._session_cache_entry()
+        if entry is not None:
+            entry[0].set(entry[1], self.session_id, self._session.cookies.get_dict())
+
+    def _resume_cached_session(self) -> Optional[GetStudentInfoResponse]:
+        """
+        Resume a fresh session from the session cache, revalidating it with a ping.
+
+        Returns:
+            The validating ping response, or None if there was no usable cached session
+        """
+        account = self._session_cache_account()
+        if self._session_cache is None or not account:
+            return None
+        cached = self._session_cache.get(account)
+        if cached is None:
+            return None
+
+        self._session.cookies.update(cached["cookies"])
+        self.session_id = cached["session_id"]
+        try:
+            return self.get_new_session_id()
+        except ClassChartsError:
+            self._session_cache.delete(account)
+            self._session.cookies.clear()
+            self.session_id = ""
+            return None
 
     def _make_authed_request(
         self,
@@ -85,10 +148,15 @@ class BaseClient(ABC):
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         revalidate_token: bool = True,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Make a request to the ClassCharts API with required authentication headers.
 
+        Successful GET responses are cached, keyed by path and params, until the session
+        changes or for cache_ttl seconds. After that, GETs of responses that came with an
+        ETag are made conditional, and a 304 reuses the previously fetched response.
+
         Args:
             path: Path to the API endpoint
             method: HTTP method (GET, POST, etc.)
@@ -97,35 +165,28 @@ class BaseClient(ABC):
             params: URL parameters
             headers: Additional headers to include in the request
             revalidate_token: Whether to revalidate the session ID if it's older than 3 minutes
+            cache_ttl: Seconds to cache a GET response for, defaults to the client's cache_ttl
 
         Returns:
             Response JSON as a dictionary
 
         Raises:
             NoSessionError: If no session ID is available
+            RateLimitError: If the API rate limits the request
             APIError: If the API returns an error response
         """
         if not self.session_id:
             raise NoSessionError("No session ID")
 
-        # Revalidate token if needed
-        if revalidate_token and self.last_ping:
-            current_time = time.time() * 1000  # Convert to milliseconds
-            if current_time - self.last_ping + 5000 > PING_INTERVAL:
-                self.get_new_session_id()
-
-        # Prepare headers
-        request_headers: Dict[str, str] = {
-            "Authorization": f"Basic {self.session_id}",
-        }
+        cache_key, cached, etag_entry = self._lookup_cache(method, path, params)
+        if cached is not None:
+            return cached
 
-        # Add cookies if available
-        if self.auth_cookies:
-            request_headers["Cookie"] = "; ".join(self.auth_cookies)
+        # Revalidate token if needed
+        if revalidate_token and time.monotonic() > self._revalidate_at:
+            self.get_new_session_id()
 
-        # Merge with any additional headers
-        if headers:
-            request_headers.update(headers)
+        request_headers = self._request_headers(headers, etag_entry)
 
         # Make the request
         response = self._session.request(
@@ -137,17 +198,21 @@ class BaseClient(ABC):
             params=params,
         )
 
-        # Parse response
-        try:
-            response_json: Dict[str, Any] = response.json()
-        except json.JSONDecodeError as e:
-            raise APIError(f"Error parsing JSON. Returned response: {response.text}") from e
-
-        if response_json.get("success") == 0:
-            error_msg = response_json.get("error", "Unknown error")
-            raise APIError(error_msg)
-
-        return response_json
+        # Don't decode the error pages returned when rate limited or on upstream failures
+        if response.status_code == 429:
+            raise RateLimitError(parse_retry_after(response.headers.get("Retry-After")))
+        if response.status_code >= 500:
+            raise APIError(f"Upstream error {response.status_code}")
+
+        return self._handle_response(
+            path,
+            response.status_code,
+            response.content,
+            response.headers.get("ETag"),
+            cache_key,
+            etag_entry,
+            cache_ttl,
+        )
 
     def get_student_info(self) -> GetStudentInfoResponse:
         """
@@ -156,13 +221,13 @@ class BaseClient(ABC):
         Returns:
             Student information response
         """
-        body = {"include_data": "true"}
         return cast(
             GetStudentInfoResponse,
             self._make_authed_request(
                 f"{self._api_base}/ping",
                 method="POST",
-                data=body,
+                data=_PING_BODY,
+                headers=_PING_HEADERS,
             ),
         )
 
@@ -184,19 +249,12 @@ class BaseClient(ABC):
         See Also:
             get_full_activity: Gets all activity data between two dates
         """
-        params: Dict[str, str] = {}
-        if options:
-            if "from_date" in options:
-                params["from"] = options["from_date"]
-            if "to_date" in options:
-                params["to"] = options["to_date"]
-            if "last_id" in options:
-                params["last_id"] = options["last_id"]
+        params = _build_query(options, "from_date", "to_date", "last_id")
 
         return cast(
             ActivityResponse,
             self._make_authed_request(
-                f"{self._api_base}/activity/{self.student_id}",
+                self._endpoints["activity"],
                 method="GET",
                 params=params,
             ),
@@ -219,12 +277,29 @@ class BaseClient(ABC):
 
         See Also:
             get_activity: Gets a single page of activity data
+            iter_full_activity: Yields the activity points page by page instead
+        """
+        return list(self.iter_full_activity(options))
+
+    def iter_full_activity(
+        self,
+        options: GetFullActivityOptions,
+    ) -> Iterator[ActivityPoint]:
+        """
+        Iterate over the current student's activity between two dates.
+
+        Pages are fetched from get_activity() as the iteration reaches them, so callers
+        that process points one at a time never hold the whole range in a single list.
+
+        Args:
+            options: Options for getting full activity data
+
+        Yields:
+            Activity points, oldest page first
         """
-        data: List[ActivityPoint] = []
         prev_last: Optional[int] = None
-        got_data = True
 
-        while got_data:
+        while True:
             params: GetActivityOptions = {
                 "from_date": options["from_date"],
                 "to_date": options["to_date"],
@@ -233,13 +308,10 @@ class BaseClient(ABC):
                 params["last_id"] = str(prev_last)
 
             fragment = self.get_activity(params)["data"]
-            if not fragment or not len(fragment):
-                got_data = False
-            else:
-                data.extend(fragment)
-                prev_last = fragment[-1]["id"]
-
-        return data
+            if not fragment:
+                return
+            prev_last = fragment[-1]["id"]
+            yield from fragment
 
     def get_behaviour(
         self,
@@ -254,17 +326,12 @@ class BaseClient(ABC):
         Returns:
             Behaviour response
         """
-        params: Dict[str, str] = {}
-        if options:
-            if "from_date" in options:
-                params["from"] = options["from_date"]
-            if "to_date" in options:
-                params["to"] = options["to_date"]
+        params = _build_query(options, "from_date", "to_date")
 
         return cast(
             BehaviourResponse,
             self._make_authed_request(
-                f"{self._api_base}/behaviour/{self.student_id}",
+                self._endpoints["behaviour"],
                 method="GET",
                 params=params,
             ),
@@ -283,19 +350,12 @@ class BaseClient(ABC):
         Returns:
             Homeworks response
         """
-        params: Dict[str, Any] = {}
-        if options:
-            if "display_date" in options:
-                params["display_date"] = options["display_date"]
-            if "from_date" in options:
-                params["from"] = options["from_date"]
-            if "to_date" in options:
-                params["to"] = options["to_date"]
+        params = _build_query(options, "display_date", "from_date", "to_date")
 
         return cast(
             HomeworksResponse,
             self._make_authed_request(
-                f"{self._api_base}/homeworks/{self.student_id}",
+                self._endpoints["homeworks"],
                 method="GET",
                 params=params,
             ),
@@ -324,7 +384,7 @@ class BaseClient(ABC):
         return cast(
             LessonsResponse,
             self._make_authed_request(
-                f"{self._api_base}/timetable/{self.student_id}",
+                self._endpoints["timetable"],
                 method="GET",
                 params=params,
             ),
@@ -340,7 +400,7 @@ class BaseClient(ABC):
         return cast(
             BadgesResponse,
             self._make_authed_request(
-                f"{self._api_base}/eventbadges/{self.student_id}",
+                self._endpoints["eventbadges"],
                 method="GET",
             ),
         )
@@ -355,7 +415,7 @@ class BaseClient(ABC):
         return cast(
             AnnouncementsResponse,
             self._make_authed_request(
-                f"{self._api_base}/announcements/{self.student_id}",
+                self._endpoints["announcements"],
                 method="GET",
             ),
         )
@@ -370,7 +430,7 @@ class BaseClient(ABC):
         return cast(
             DetentionsResponse,
             self._make_authed_request(
-                f"{self._api_base}/detentions/{self.student_id}",
+                self._endpoints["detentions"],
                 method="GET",
             ),
         )
@@ -388,17 +448,12 @@ class BaseClient(ABC):
         Returns:
             Attendance response
         """
-        params: Dict[str, str] = {}
-        if options:
-            if "from_date" in options:
-                params["from"] = options["from_date"]
-            if "to_date" in options:
-                params["to"] = options["to_date"]
+        params = _build_query(options, "from_date", "to_date")
 
         return cast(
             AttendanceResponse,
             self._make_authed_request(
-                f"{self._api_base}/attendance/{self.student_id}",
+                self._endpoints["attendance"],
                 method="GET",
                 params=params,
             ),
@@ -414,7 +469,7 @@ class BaseClient(ABC):
         return cast(
             PupilFieldsResponse,
             self._make_authed_request(
-                f"{self._api_base}/customfields/{self.student_id}",
+                self._endpoints["customfields"],
                 method="GET",
             ),
         )
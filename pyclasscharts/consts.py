@@ -5,3 +5,11 @@ API_BASE_STUDENT = f"{BASE_URL}/apiv2student"
 API_BASE_PARENT = f"{BASE_URL}/apiv2parent"
 
 PING_INTERVAL = 60 * 3 * 1000  # 3 minutes in milliseconds
+# Revalidate the session 5 seconds before the 3 minute ping interval runs out
+PING_INTERVAL_SECONDS = 60 * 3 - 5
+# The pupils linked to a parent account rarely change, so they are cached for longer
+PUPILS_CACHE_TTL_SECONDS = 60 * 3
+# Number of GET responses whose ETag is kept for conditional requests
+ETAG_CACHE_SIZE = 64
+# Number of bytes of an unparseable response body included in the error message
+ERROR_BODY_LIMIT = 512
@@ -1,5 +1,7 @@
 """Custom exceptions for the ClassCharts API."""
 
+from typing import Optional
+
 
 class ClassChartsError(Exception):
     """Base exception for all ClassCharts API errors."""
@@ -13,6 +15,21 @@ class APIError(ClassChartsError):
     """Raised when the API returns an error response."""
 
 
+class RateLimitError(APIError):
+    """Raised when the API rejects a request for exceeding its rate limit."""
+
+    def __init__(self, retry_after: Optional[float] = None) -> None:
+        """
+        Args:
+            retry_after: Seconds to wait before retrying, from the Retry-After header
+        """
+        self.retry_after = retry_after
+        if retry_after is None:
+            super().__init__("Rate limited")
+        else:
+            super().__init__(f"Rate limited; retry after {retry_after:g}s")
+
+
 class NoSessionError(ClassChartsError):
     """Raised when no session ID is available."""
 
@@ -0,0 +1,227 @@
+"""Attribute-access models for items decoded in bulk from list responses.
+
+The clients return plain dicts described by the TypedDicts in pyclasscharts.types.
+These frozen dataclasses are an opt-in alternative for code that holds on to many
+items: they have no per-instance __dict__ on Python 3.10+ and read fields by
+attribute. Keys missing from the API data are set to None.
+
+Example:
+    >>> from pyclasscharts.models import Homework
+    >>> homeworks = Homework.from_api_list(client.get_homeworks()["data"])
+    >>> homeworks[0].due_date
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_origin,
+)
+
+from pyclasscharts.types import (
+    ACTIVITY_POLARITIES,
+    ACTIVITY_TYPES,
+    ATTENDED_STATES,
+    DetentionLesson,
+    DetentionLessonPupilBehaviour,
+    DetentionPupil,
+    DetentionTeacher,
+    DetentionType,
+    HomeworkStatus,
+    TeacherValidatedHomeworkAttachment,
+    TeacherValidatedHomeworkLink,
+)
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_M = TypeVar("_M", bound="_Model")
+
+# Fixed-vocabulary values repeated across every item of a response. Mapping them to
+# one shared string each saves a separate copy per item, as the JSON decoder returns
+# a new string every time.
+_VOCABULARY: Dict[str, str] = {
+    value: sys.intern(value) for value in ACTIVITY_TYPES | ACTIVITY_POLARITIES | ATTENDED_STATES
+}
+
+
+def _generate_from_api(cls: type) -> Any:
+    """
+    Generate a from_api() classmethod specialised to a model's fields.
+
+    It is built from source, the way dataclasses generates __init__, so converting each
+    item is a single call reading every key directly rather than a loop over the fields.
+    """
+    names = [
+        name
+        for name, hint in getattr(cls, "__annotations__", {}).items()
+        if get_origin(hint) is not ClassVar and hint is not ClassVar
+    ]
+    vocabulary_fields = getattr(cls, "_vocabulary_fields", ())
+    lines = ["def from_api(cls, data):", "    get = data.get"]
+    args = []
+    for i, name in enumerate(names):
+        if name in vocabulary_fields:
+            lines.append(f"    _{i} = get({name!r})")
+            args.append(f"        {name}=vocabulary(_{i}, _{i}),")
+        else:
+            args.append(f"        {name}=get({name!r}),")
+    source = "\n".join([*lines, "    return cls(", *args, "    )"])
+    namespace: Dict[str, Any] = {}
+    exec(source, {"vocabulary": _VOCABULARY.get}, namespace)
+    from_api = namespace["from_api"]
+    from_api.__qualname__ = f"{cls.__qualname__}.from_api"
+    from_api.__doc__ = """
+        Create a model from an item of API data.
+
+        Args:
+            data: Item as decoded from the API response
+
+        Returns:
+            The model, with missing keys set to None
+        """
+    return classmethod(from_api)
+
+
+class _Model:
+    """Base class providing construction from API data."""
+
+    __slots__ = ()
+
+    # Fields whose values are looked up in _VOCABULARY
+    _vocabulary_fields: ClassVar[Tuple[str, ...]] = ()
+
+    if TYPE_CHECKING:
+
+        @classmethod
+        def from_api(cls: Type[_M], data: Mapping[str, Any]) -> _M:
+            """Create a model from an item of API data; generated for each model."""
+            ...
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every model gets its own constructor, so there is no base version to forget
+        # to override
+        cls.from_api = _generate_from_api(cls)  # type: ignore[method-assign]
+
+    @classmethod
+    def from_api_list(cls: Type[_M], items: Iterable[Mapping[str, Any]]) -> List[_M]:
+        """
+        Create models from a list of API data, such as a response's "data".
+
+        Args:
+            items: Items as decoded from the API response
+
+        Returns:
+            A list of models
+        """
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
+
+
+def _model(cls: Type[_M]) -> Type[_M]:
+    """Turn a model class into a frozen, slotted dataclass."""
+    return dataclass(frozen=True, **_SLOTS)(cls)
+
+
+@_model
+class ActivityPoint(_Model):
+    """An activity point."""
+
+    _vocabulary_fields = ("type", "polarity")
+
+    id: int
+    type: str
+    polarity: Optional[str]
+    reason: str
+    score: int
+    timestamp: str
+    timestamp_custom_time: Optional[str]
+    style: Dict[str, Optional[str]]
+    pupil_name: str
+    lesson_name: Optional[str]
+    teacher_name: Optional[str]
+    room_name: Optional[str]
+    note: Optional[str]
+    _can_delete: bool
+    badges: str
+    detention_date: Optional[str]
+    detention_time: Optional[str]
+    detention_location: Optional[str]
+    detention_type: Optional[str]
+
+
+@_model
+class Homework(_Model):
+    """Homework information."""
+
+    lesson: str
+    subject: str
+    teacher: str
+    homework_type: str
+    id: int
+    title: str
+    meta_title: str
+    description: str
+    issue_date: str
+    due_date: str
+    completion_time_unit: str
+    completion_time_value: str
+    publish_time: str
+    status: HomeworkStatus
+    validated_links: List[TeacherValidatedHomeworkLink]
+    validated_attachments: List[TeacherValidatedHomeworkAttachment]
+
+
+@_model
+class Lesson(_Model):
+    """Lesson information."""
+
+    teacher_name: str
+    teacher_id: str
+    lesson_name: str
+    subject_name: str
+    is_alternative_lesson: bool
+    is_break: bool
+    period_name: str
+    period_number: str
+    room_name: str
+    date: str
+    start_time: str
+    end_time: str
+    key: int
+    note_abstract: str
+    note: str
+    pupil_note_abstract: str
+    pupil_note: str
+    pupil_note_raw: str
+
+
+@_model
+class Detention(_Model):
+    """Detention information."""
+
+    _vocabulary_fields = ("attended",)
+
+    id: int
+    attended: str
+    date: Optional[str]
+    length: Optional[int]
+    location: Optional[str]
+    notes: Optional[str]
+    time: Optional[str]
+    pupil: DetentionPupil
+    lesson: Optional[DetentionLesson]
+    lesson_pupil_behaviour: DetentionLessonPupilBehaviour
+    teacher: Optional[DetentionTeacher]
+    detention_type: Optional[DetentionType]
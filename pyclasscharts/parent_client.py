@@ -1,15 +1,14 @@
 """Parent client for ClassCharts API."""
 
-import json
-from typing import List, cast
-
-import requests
+from typing import Dict, List, Optional, cast
+from urllib.parse import unquote
 
 from pyclasscharts.base_client import BaseClient
-from pyclasscharts.consts import API_BASE_PARENT, BASE_URL
+from pyclasscharts.consts import API_BASE_PARENT, BASE_URL, PUPILS_CACHE_TTL_SECONDS
 from pyclasscharts.exceptions import AuthenticationError, ValidationError
+from pyclasscharts.session_cache import SessionCache
 from pyclasscharts.types import ChangePasswordResponse, GetPupilsResponse, Pupil
-from pyclasscharts.utils import parse_cookies
+from pyclasscharts.utils import json_loads
 
 
 class ParentClient(BaseClient):
@@ -25,23 +24,47 @@ class ParentClient(BaseClient):
         >>> pupils = client.get_pupils()
     """
 
-    def __init__(self, email: str, password: str) -> None:
+    __slots__ = ("_pupils", "_pupils_by_id", "email", "password")
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        session_cache: Optional[SessionCache] = None,
+    ) -> None:
         """
         Initialize a parent client.
 
         Args:
             email: Parent's email address
             password: Parent's password
+            session_cache: Optional on-disk cache used to resume sessions across processes
         """
-        super().__init__(API_BASE_PARENT)
+        super().__init__(API_BASE_PARENT, session_cache)
         self.email = str(email)
         self.password = str(password)
-        self.pupils: List[Pupil] = []
+        self._pupils: List[Pupil] = []
+        self._pupils_by_id: Dict[int, Pupil] = {}
+
+    @property
+    def pupils(self) -> List[Pupil]:
+        """Pupils connected to this parent's account, as fetched on login."""
+        return self._pupils
+
+    @pupils.setter
+    def pupils(self, value: List[Pupil]) -> None:
+        self._pupils = value
+        self._pupils_by_id = {pupil["id"]: pupil for pupil in value}
+
+    def _session_cache_account(self) -> str:
+        return self.email
 
     def login(self) -> None:
         """
         Authenticate with ClassCharts.
 
+        If the client has a session cache, a fresh cached session is resumed instead.
+
         Raises:
             ValidationError: If email or password is not provided
             AuthenticationError: If authentication fails
@@ -51,6 +74,18 @@ class ParentClient(BaseClient):
         if not self.password:
             raise ValidationError("Password not provided")
 
+        if self._resume_cached_session() is None:
+            self._authenticate()
+            self._save_session()
+
+        self.pupils = self.get_pupils()
+        if not self.pupils:
+            raise ValidationError("Account has no pupils attached")
+
+        self.student_id = self.pupils[0]["id"]
+
+    def _authenticate(self) -> None:
+        """Log in with the email and password to obtain a new session ID."""
         form_data = {
             "_method": "POST",
             "email": self.email,
@@ -63,7 +98,7 @@ class ParentClient(BaseClient):
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{BASE_URL}/parent/login",
             data=form_data,
             headers=headers,
@@ -75,35 +110,32 @@ class ParentClient(BaseClient):
                 "Unauthenticated: ClassCharts didn't return authentication cookies"
             )
 
-        cookies = response.headers.get("set-cookie", "")
-        session_cookies = parse_cookies(cookies)
-        session_credentials = session_cookies.get("parent_session_credentials", "")
+        # The session has already parsed the Set-Cookie headers into its cookie jar
+        credentials_cookie = self._session.cookies.get("parent_session_credentials")
+        session_credentials = unquote(credentials_cookie) if credentials_cookie else ""
 
         if not session_credentials:
             raise AuthenticationError("Failed to extract session credentials")
 
         try:
-            session_id_data = json.loads(session_credentials)
+            session_id_data = json_loads(session_credentials)
             self.session_id = session_id_data["session_id"]
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             raise AuthenticationError("Failed to parse session credentials") from e
 
-        self.pupils = self.get_pupils()
-        if not self.pupils:
-            raise ValidationError("Account has no pupils attached")
-
-        self.student_id = self.pupils[0]["id"]
-
     def get_pupils(self) -> GetPupilsResponse:
         """
         Get a list of pupils connected to this parent's account.
 
+        The list is cached until the session changes, for up to 3 minutes.
+
         Returns:
             A list of pupils connected to this parent's account
         """
         response = self._make_authed_request(
             f"{self._api_base}/pupils",
             method="GET",
+            cache_ttl=PUPILS_CACHE_TTL_SECONDS,
         )
         return cast(GetPupilsResponse, response["data"])
 
@@ -123,12 +155,11 @@ class ParentClient(BaseClient):
         if not pupil_id:
             raise ValidationError("No pupil ID specified")
 
-        for pupil in self.pupils:
-            if pupil["id"] == pupil_id:
-                self.student_id = pupil["id"]
-                return
+        pupil = self._pupils_by_id.get(pupil_id)
+        if pupil is None:
+            raise ValidationError("No pupil with specified ID found")
 
-        raise ValidationError("No pupil with specified ID found")
+        self.student_id = pupil["id"]
 
     def change_password(
         self,
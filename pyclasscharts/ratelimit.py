@@ -0,0 +1,127 @@
+"""Client-side throttling and backoff for the asyncio clients."""
+
+import asyncio
+import random
+import time
+import weakref
+from typing import Any, Dict, Mapping, Optional
+
+from pyclasscharts.utils import parse_retry_after
+
+# Backoff between retries grows exponentially from INITIAL up to MAX seconds
+BACKOFF_INITIAL_SECONDS = 0.3
+BACKOFF_MAX_SECONDS = 10.0
+
+
+class RateLimiter:
+    """
+    Limit concurrent requests to a host and pause them when the server asks.
+
+    The limiter is an async context manager held for the duration of a request. It
+    caps the number of requests in flight on each event loop, and once a response
+    carries Retry-After or reports that no requests remain, new requests on every
+    loop wait until the pause is over.
+    """
+
+    def __init__(self, max_concurrency: int = 16) -> None:
+        """
+        Create a rate limiter.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight at once on each event loop
+        """
+        self.max_concurrency = max_concurrency
+        self._resume_at = 0.0  # time.monotonic() before which no request is sent
+        # Semaphores are tied to an event loop, so each loop, possibly in its own
+        # thread, gets its own. A request enters and exits on the same loop, so it
+        # always releases the semaphore it acquired.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def __aenter__(self) -> "RateLimiter":
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        try:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            # __aexit__ doesn't run if entering fails, e.g. when cancelled during a pause
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._get_semaphore().release()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back new requests for the given number of seconds.
+
+        Args:
+            seconds: How long to wait before sending another request
+        """
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def update(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Pace future requests from the rate limit headers of a response.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            The Retry-After delay in seconds, or None if the response didn't give one
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            # A long Retry-After makes the request fail instead, so it needn't stall
+            # every other request to the host for that long
+            self.pause(min(retry_after, BACKOFF_MAX_SECONDS))
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            self.pause(BACKOFF_INITIAL_SECONDS)
+        return retry_after
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_limiter(host: str) -> RateLimiter:
+    """
+    Get the rate limiter shared by all clients talking to a host.
+
+    Args:
+        host: Host name, optionally with a port
+
+    Returns:
+        The host's rate limiter
+    """
+    limiter = _limiters.get(host)
+    if limiter is None:
+        limiter = _limiters[host] = RateLimiter()
+    return limiter
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Get how long to wait before retrying a request.
+
+    Args:
+        attempt: Number of retries already made
+        retry_after: Delay requested by the server, if any
+
+    Returns:
+        The server's delay if given, otherwise an exponential delay with jitter, at most
+        BACKOFF_MAX_SECONDS either way
+    """
+    if retry_after is not None:
+        return min(retry_after, BACKOFF_MAX_SECONDS)
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_INITIAL_SECONDS * 2.0**attempt)
+    return delay + random.uniform(0, BACKOFF_INITIAL_SECONDS)
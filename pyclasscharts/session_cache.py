@@ -0,0 +1,130 @@
+"""On-disk cache of ClassCharts sessions, shared between processes."""
+
+import dbm
+import hashlib
+import os
+import shelve
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, TypedDict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+from pyclasscharts.consts import PING_INTERVAL_SECONDS
+
+
+class CachedSession(TypedDict):
+    """Session credentials stored in the cache."""
+
+    session_id: str
+    cookies: Dict[str, str]
+    timestamp: float  # time.time() of the last successful login or ping
+
+
+def default_cache_path() -> str:
+    """
+    Get the default location of the session cache.
+
+    Returns:
+        A path inside $XDG_CACHE_HOME (or ~/.cache) for the cache database
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pyclasscharts", "sessions")
+
+
+class SessionCache:
+    """
+    Persist session credentials so a new process can skip the full login.
+
+    Entries are keyed by a hash of the account identifier (parent email or student
+    code) and are only reused while the session is younger than the ping interval.
+    A resumed session is always revalidated with a ping before use.
+
+    The cache holds live credentials, so its directory is created readable only by
+    the current user and its files with mode 0600. Access is serialised between
+    processes with a lock file on POSIX systems; on Windows there is no locking and
+    only one process should use a cache at a time.
+
+    Example:
+        >>> from pyclasscharts import ParentClient
+        >>> from pyclasscharts.session_cache import SessionCache
+        >>> client = ParentClient("username", "password", session_cache=SessionCache())
+        >>> client.login()  # Reuses the previous process's session if still fresh
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = PING_INTERVAL_SECONDS) -> None:
+        """
+        Create a session cache.
+
+        Args:
+            path: Path of the cache database, defaults to default_cache_path()
+            ttl: Maximum age in seconds of a cached session that will be reused
+        """
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(account: str) -> str:
+        return hashlib.sha256(account.encode()).hexdigest()
+
+    @contextmanager
+    def _open(self) -> Iterator["shelve.Shelf[CachedSession]"]:
+        os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+        lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # Some dbm backends, such as dbm.dumb, are unsafe with concurrent writers
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # shelve.open() can't set the mode of the files it creates
+            shelf: shelve.Shelf[CachedSession] = shelve.Shelf(
+                dbm.open(self.path, "c", 0o600)  # type: ignore[arg-type]
+            )
+            with shelf:
+                yield shelf
+        finally:
+            os.close(lock_fd)  # Also releases the lock
+
+    def get(self, account: str) -> Optional[CachedSession]:
+        """
+        Get the cached session for an account if it is still fresh.
+
+        Args:
+            account: Parent email or student code
+
+        Returns:
+            The cached session, or None if there is no fresh entry
+        """
+        with self._open() as shelf:
+            cached = shelf.get(self._key(account))
+        if cached is None or time.time() - cached["timestamp"] >= self.ttl:
+            return None
+        return cached
+
+    def set(self, account: str, session_id: str, cookies: Dict[str, str]) -> None:
+        """
+        Store the current session for an account.
+
+        Args:
+            account: Parent email or student code
+            session_id: Current session ID
+            cookies: Session cookies, by name
+        """
+        with self._open() as shelf:
+            shelf[self._key(account)] = {
+                "session_id": session_id,
+                "cookies": dict(cookies),
+                "timestamp": time.time(),
+            }
+
+    def delete(self, account: str) -> None:
+        """
+        Remove the cached session for an account.
+
+        Args:
+            account: Parent email or student code
+        """
+        with self._open() as shelf:
+            shelf.pop(self._key(account), None)
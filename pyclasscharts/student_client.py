@@ -1,20 +1,19 @@
 """Student client for ClassCharts API."""
 
-import json
-from typing import cast
-
-import requests
+from typing import Optional, cast
+from urllib.parse import unquote
 
 from pyclasscharts.base_client import BaseClient
 from pyclasscharts.consts import API_BASE_STUDENT, BASE_URL
 from pyclasscharts.exceptions import AuthenticationError, ValidationError
+from pyclasscharts.session_cache import SessionCache
 from pyclasscharts.types import (
     GetStudentCodeOptions,
     GetStudentCodeResponse,
     RewardPurchaseResponse,
     RewardsResponse,
 )
-from pyclasscharts.utils import parse_cookies
+from pyclasscharts.utils import json_loads
 
 
 class StudentClient(BaseClient):
@@ -30,22 +29,37 @@ class StudentClient(BaseClient):
         >>> client.login()
     """
 
-    def __init__(self, student_code: str, date_of_birth: str = "") -> None:
+    __slots__ = ("date_of_birth", "student_code")
+
+    _student_routes = BaseClient._student_routes + ("rewards",)
+
+    def __init__(
+        self,
+        student_code: str,
+        date_of_birth: str = "",
+        session_cache: Optional[SessionCache] = None,
+    ) -> None:
         """
         Initialize a student client.
 
         Args:
             student_code: ClassCharts student code
             date_of_birth: Student's date of birth (format: DD/MM/YYYY)
+            session_cache: Optional on-disk cache used to resume sessions across processes
         """
-        super().__init__(API_BASE_STUDENT)
+        super().__init__(API_BASE_STUDENT, session_cache)
         self.student_code = str(student_code)
         self.date_of_birth = str(date_of_birth)
 
+    def _session_cache_account(self) -> str:
+        return self.student_code.upper()
+
     def login(self) -> None:
         """
         Authenticate with ClassCharts.
 
+        If the client has a session cache, a fresh cached session is resumed instead.
+
         Raises:
             ValidationError: If student code is not provided
             AuthenticationError: If authentication fails
@@ -53,6 +67,15 @@ class StudentClient(BaseClient):
         if not self.student_code:
             raise ValidationError("Student Code not provided")
 
+        ping_data = self._resume_cached_session()
+        if ping_data is None:
+            self._authenticate()
+            # The ping response already includes the student, so no separate info request
+            ping_data = self.get_new_session_id()
+        self.student_id = ping_data["data"]["user"]["id"]
+
+    def _authenticate(self) -> None:
+        """Log in with the student code and date of birth to obtain a new session ID."""
         form_data = {
             "_method": "POST",
             "code": self.student_code.upper(),
@@ -61,7 +84,7 @@ class StudentClient(BaseClient):
             "recaptcha-token": "no-token-available",
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{BASE_URL}/student/login",
             data=form_data,
             allow_redirects=False,
@@ -72,24 +95,19 @@ class StudentClient(BaseClient):
                 "Unauthenticated: ClassCharts didn't return authentication cookies"
             )
 
-        cookies = response.headers.get("set-cookie", "")
-        self.auth_cookies = cookies.split(",")
-        session_cookies = parse_cookies(cookies)
-        session_credentials = session_cookies.get("student_session_credentials", "")
+        # The session has already parsed the Set-Cookie headers into its cookie jar
+        credentials_cookie = self._session.cookies.get("student_session_credentials")
+        session_credentials = unquote(credentials_cookie) if credentials_cookie else ""
 
         if not session_credentials:
             raise AuthenticationError("Failed to extract session credentials")
 
         try:
-            session_id_data = json.loads(session_credentials)
+            session_id_data = json_loads(session_credentials)
             self.session_id = session_id_data["session_id"]
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             raise AuthenticationError("Failed to parse session credentials") from e
 
-        self.get_new_session_id()
-        user = self.get_student_info()
-        self.student_id = user["data"]["user"]["id"]
-
     def get_rewards(self) -> RewardsResponse:
         """
         Get the available items in the current student's rewards shop.
@@ -100,7 +118,7 @@ class StudentClient(BaseClient):
         return cast(
             RewardsResponse,
             self._make_authed_request(
-                f"{self._api_base}/rewards/{self.student_id}",
+                self._endpoints["rewards"],
                 method="GET",
             ),
         )
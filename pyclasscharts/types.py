@@ -135,6 +135,13 @@ class GetFullActivityOptions(TypedDict):
     to_date: str  # YYYY-MM-DD format
 
 
+# Values of ActivityPoint.type and ActivityPoint.polarity
+ACTIVITY_TYPES = frozenset(
+    {"detention", "notice", "attendance_event", "question", "event", "behaviour"}
+)
+ACTIVITY_POLARITIES = frozenset({"positive", "blank", "negative"})
+
+
 class ActivityPoint(TypedDict, total=False):
     """An activity point."""
 
@@ -418,6 +425,10 @@ class DetentionType(TypedDict, total=False):
     name: str
 
 
+# Values of Detention.attended
+ATTENDED_STATES = frozenset({"yes", "no", "upscaled", "pending"})
+
+
 class Detention(TypedDict, total=False):
     """Detention information."""
 
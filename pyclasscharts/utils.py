@@ -1,8 +1,17 @@
 """Utility functions for the ClassCharts API."""
 
-from typing import Dict
+from typing import Dict, Optional
 from urllib.parse import unquote
 
+try:
+    # orjson is an optional, faster drop-in for decoding API responses. Its
+    # JSONDecodeError subclasses ValueError just like the stdlib's.
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - depends on the installed extras
+    from json import loads as json_loads  # type: ignore[assignment]
+
+__all__ = ["json_loads", "parse_cookies", "parse_retry_after"]
+
 
 def parse_cookies(cookie_string: str) -> Dict[str, str]:
     """
@@ -15,13 +24,44 @@ def parse_cookies(cookie_string: str) -> Dict[str, str]:
         A dictionary of cookie names to values
     """
     output: Dict[str, str] = {}
-    cookies = cookie_string.split(",")
-    for cookie in cookies:
-        cookie_part = cookie.split(";")[0]
-        if "=" in cookie_part:
-            key, value = cookie_part.split("=", 1)
-            # Decode URL-encoded cookie names and values (like JavaScript's decodeURIComponent)
-            decoded_key = unquote(key).lstrip()
-            decoded_value = unquote(value)
-            output[decoded_key] = decoded_value
+    find = cookie_string.find
+    length = len(cookie_string)
+    pos = 0
+    while pos < length:
+        # Each cookie runs to the next comma and its name=value pair to the first ";".
+        # The pieces left by commas in Expires dates have no "=" before their ";", so
+        # they are skipped along with the attributes.
+        end = find(",", pos)
+        if end == -1:
+            end = length
+        term = find(";", pos, end)
+        if term == -1:
+            term = end
+        eq = find("=", pos, term)
+        if eq != -1:
+            key = cookie_string[pos:eq]
+            value = cookie_string[eq + 1 : term]
+            # Decode URL-encoded cookie names and values (like JavaScript's decodeURIComponent),
+            # skipping the common case where there is nothing to decode
+            key = (unquote(key) if "%" in key else key).lstrip()
+            output[key] = unquote(value) if "%" in value else value
+        pos = end + 1
     return output
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: The Retry-After header value, if any
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing or an HTTP date
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
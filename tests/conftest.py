@@ -1,44 +1,44 @@
 """Pytest configuration and shared fixtures."""
 
-import pytest
+import copy
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
+import requests
+import responses
 
-@pytest.fixture
-def mock_requests(monkeypatch):
-    """Fixture to mock requests library."""
-    from unittest.mock import Mock
+from pyclasscharts.student_client import StudentClient
 
-    import requests
+# Copying a configured Mock is cheaper than constructing a new one for every test
+_RESPONSE_TEMPLATE = Mock(spec_set=["status_code", "headers"])
 
-    class MockResponse:
-        def __init__(self, status_code=200, headers=None, json_data=None, text=""):
-            self.status_code = status_code
-            self.headers = headers or {}
-            self._json_data = json_data
-            self.text = text
 
-        def json(self):
-            return self._json_data or {}
+@pytest.fixture
+def http():
+    """Fixture intercepting requests' HTTP transport; register responses with http.add()."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rm:
+        yield rm
 
-    mock_post = Mock()
-    mock_get = Mock()
-    mock_request = Mock()
 
-    def mock_post_func(*args, **kwargs):
-        return MockResponse()
+@pytest.fixture
+def login_mocks(monkeypatch):
+    """Mock the student login request and the ping that follows it."""
+    post = Mock(spec=requests.Session.post)
+    get_new_session_id = Mock(spec=StudentClient.get_new_session_id)
+    monkeypatch.setattr(requests.Session, "post", post)
+    monkeypatch.setattr(StudentClient, "get_new_session_id", get_new_session_id)
+    return SimpleNamespace(post=post, get_new_session_id=get_new_session_id)
 
-    def mock_get_func(*args, **kwargs):
-        return MockResponse()
 
-    def mock_request_func(self, *args, **kwargs):
-        return MockResponse()
+@pytest.fixture
+def login_response():
+    """Fixture creating mock login responses from a status code and headers."""
 
-    monkeypatch.setattr(requests, "post", mock_post_func)
-    monkeypatch.setattr(requests, "get", mock_get_func)
-    monkeypatch.setattr(requests.Session, "request", mock_request_func)
+    def make(status_code, headers):
+        response = copy.copy(_RESPONSE_TEMPLATE)
+        response.status_code = status_code
+        response.headers = headers
+        return response
 
-    return {
-        "post": mock_post,
-        "get": mock_get,
-        "request": mock_request,
-    }
+    return make
@@ -0,0 +1,291 @@
+"""Tests for AsyncBaseClient."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pyclasscharts.async_base_client import AsyncBaseClient  # noqa: E402
+from pyclasscharts.consts import PING_INTERVAL_SECONDS  # noqa: E402
+from pyclasscharts.exceptions import APIError, NoSessionError, RateLimitError  # noqa: E402
+from pyclasscharts.ratelimit import BACKOFF_MAX_SECONDS  # noqa: E402
+
+
+class ConcreteAsyncBaseClient(AsyncBaseClient):
+    """Concrete implementation of AsyncBaseClient for testing."""
+
+    def __init__(self, api_base: str = "https://test.api"):
+        super().__init__(api_base)
+
+    async def login(self):
+        """Mock login implementation."""
+        self.session_id = "test_session"
+        self.last_ping = time.monotonic()
+
+
+def mock_session_request(json_data=None, text="", status=200, headers=None):
+    """Build a mock for aiohttp.ClientSession.request used as an async context manager."""
+    response = MagicMock(status=status, headers=headers or {})
+    content = json.dumps(json_data).encode() if json_data is not None else text.encode()
+    response.read = AsyncMock(return_value=content)
+    request = MagicMock()
+    request.return_value.__aenter__.return_value = response
+    return request
+
+
+class TestAsyncBaseClient:
+    """Test cases for AsyncBaseClient."""
+
+    def test_no_session_id_raises_error(self):
+        """Test that making a request without a session ID raises NoSessionError."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client._make_authed_request("https://test.api/endpoint")
+
+        with pytest.raises(NoSessionError, match="No session ID"):
+            asyncio.run(run())
+
+    def test_api_error_on_failed_response(self):
+        """Test that API errors are raised when success is 0."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = mock_session_request(
+                    {"success": 0, "error": "Test error message", "data": {}, "meta": {}}
+                )
+                with patch.object(client._get_session(), "request", mock_request):
+                    await client._make_authed_request("https://test.api/endpoint")
+
+        with pytest.raises(APIError, match="Test error message"):
+            asyncio.run(run())
+
+    def test_json_decode_error(self):
+        """Test that JSON decode errors are handled properly."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = mock_session_request(text="Not JSON")
+                with patch.object(client._get_session(), "request", mock_request):
+                    await client._make_authed_request("https://test.api/endpoint")
+
+        with pytest.raises(APIError, match="Error parsing JSON"):
+            asyncio.run(run())
+
+    def test_concurrent_requests(self):
+        """Test that independent get_* calls can be gathered."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                client.student_id = 7
+                mock_request = mock_session_request({"success": 1, "data": [], "meta": {}})
+                with patch.object(client._get_session(), "request", mock_request):
+                    await asyncio.gather(
+                        client.get_lessons({"date": "2024-01-15"}),
+                        client.get_homeworks(),
+                        client.get_behaviour(),
+                    )
+                return [call.args[1] for call in mock_request.call_args_list]
+
+        urls = asyncio.run(run())
+        assert sorted(urls) == [
+            "https://test.api/behaviour/7",
+            "https://test.api/homeworks/7",
+            "https://test.api/timetable/7",
+        ]
+
+    def test_stale_session_revalidated_once_for_concurrent_requests(self):
+        """Test that requests gathered on a stale session share a single ping."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                client.last_ping = time.monotonic() - PING_INTERVAL_SECONDS - 1
+                mock_request = mock_session_request(
+                    {"success": 1, "data": [], "meta": {"session_id": "renewed"}}
+                )
+                response = mock_request.return_value.__aenter__.return_value
+                content = await response.read()
+
+                async def slow_read():
+                    await asyncio.sleep(0)  # Let the other requests run mid-ping
+                    return content
+
+                response.read = AsyncMock(side_effect=slow_read)
+                with patch.object(client._get_session(), "request", mock_request):
+                    await asyncio.gather(
+                        *(
+                            client._make_authed_request(f"https://test.api/endpoint/{i}")
+                            for i in range(8)
+                        )
+                    )
+                urls = [call.args[1] for call in mock_request.call_args_list]
+                return urls, client.session_id
+
+        urls, session_id = asyncio.run(run())
+        assert urls.count("https://test.api/ping") == 1
+        assert len(urls) == 9
+        assert session_id == "renewed"
+
+    def test_get_full_activity_paginates(self):
+        """Test that get_full_activity follows last_id until an empty page."""
+        pages = {
+            None: [{"id": 1}, {"id": 2}],
+            "2": [{"id": 3}],
+            "3": [],
+        }
+
+        async def fake_get_activity(options):
+            return {"success": 1, "data": pages[options.get("last_id")], "meta": {}}
+
+        async def run():
+            client = ConcreteAsyncBaseClient()
+            with patch.object(
+                ConcreteAsyncBaseClient, "get_activity", side_effect=fake_get_activity
+            ):
+                return await client.get_full_activity(
+                    {"from_date": "2024-01-01", "to_date": "2024-01-31"}
+                )
+
+        assert asyncio.run(run()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    @patch("pyclasscharts.async_base_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limited_request_is_retried(self, mock_sleep):
+        """Test that a rate limited request waits for Retry-After and is retried."""
+        limited = mock_session_request(status=429, headers={"Retry-After": "0"})
+        ok = mock_session_request({"success": 1, "data": [1], "meta": {}})
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = MagicMock(side_effect=[limited.return_value, ok.return_value])
+                with patch.object(client._get_session(), "request", mock_request):
+                    result = await client._make_authed_request(
+                        "https://test.api/endpoint", method="POST"
+                    )
+                return result, mock_request.call_count
+
+        result, calls = asyncio.run(run())
+        assert result["data"] == [1]
+        assert calls == 2
+        mock_sleep.assert_awaited_once_with(0.0)
+
+    @patch("pyclasscharts.async_base_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limit_error_after_max_retries(self, mock_sleep):
+        """Test that RateLimitError is raised once retries are exhausted."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = mock_session_request(status=429)
+                with patch.object(client._get_session(), "request", mock_request):
+                    await client._make_authed_request("https://test.api/endpoint")
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(run())
+        assert mock_sleep.await_count == AsyncBaseClient.max_retries
+
+    @patch("pyclasscharts.async_base_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_long_retry_after_raises_immediately(self, mock_sleep):
+        """Test that a Retry-After longer than the backoff cap isn't waited out."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = mock_session_request(status=429, headers={"Retry-After": "3600"})
+                limiter = client._rate_limiter
+                with patch.object(client._get_session(), "request", mock_request):
+                    with pytest.raises(RateLimitError) as exc_info:
+                        await client._make_authed_request("https://test.api/endpoint")
+                resume_at = limiter._resume_at
+                # The limiter is shared per host, so don't leave other tests paused
+                limiter._resume_at = 0.0
+                return exc_info.value, mock_request.call_count, resume_at
+
+        error, calls, resume_at = asyncio.run(run())
+        assert error.retry_after == 3600.0
+        assert calls == 1
+        mock_sleep.assert_not_awaited()
+        assert resume_at <= time.monotonic() + BACKOFF_MAX_SECONDS
+
+    @patch("pyclasscharts.async_base_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_upstream_error_not_retried_for_post(self, mock_sleep):
+        """Test that POSTs are not repeated after an upstream failure."""
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                mock_request = mock_session_request(status=503)
+                with patch.object(client._get_session(), "request", mock_request):
+                    try:
+                        await client._make_authed_request(
+                            "https://test.api/endpoint", method="POST"
+                        )
+                    finally:
+                        assert mock_request.call_count == 1
+
+        with pytest.raises(APIError, match="Upstream error 503"):
+            asyncio.run(run())
+        mock_sleep.assert_not_awaited()
+
+    def test_conditional_get_reuses_unchanged_response(self):
+        """Test that a 304 for a GET with a known ETag reuses the parsed response."""
+        fresh = mock_session_request(
+            {"success": 1, "data": [1], "meta": {}}, headers={"ETag": "v1"}
+        )
+        unchanged = mock_session_request(status=304)
+
+        async def run():
+            async with ConcreteAsyncBaseClient() as client:
+                await client.login()
+                client.cache_ttl = 0
+                mock_request = MagicMock(side_effect=[fresh.return_value, unchanged.return_value])
+                with patch.object(client._get_session(), "request", mock_request):
+                    first = await client._make_authed_request("https://test.api/endpoint")
+                    second = await client._make_authed_request("https://test.api/endpoint")
+                return first, second, mock_request.call_args_list[1].kwargs["headers"]
+
+        first, second, headers = asyncio.run(run())
+        assert second == first
+        assert headers["If-None-Match"] == "v1"
+
+    def test_iter_full_activity_stops_early(self):
+        """Test that breaking out of iter_full_activity cancels the prefetched page."""
+        cancelled = []
+
+        async def fake_get_activity(options):
+            last_id = options.get("last_id")
+            if last_id is None:
+                return {"success": 1, "data": [{"id": 1}], "meta": {}}
+            try:
+                await asyncio.Event().wait()  # The next page never arrives
+            except asyncio.CancelledError:
+                cancelled.append(last_id)
+                raise
+
+        async def run():
+            client = ConcreteAsyncBaseClient()
+            with patch.object(
+                ConcreteAsyncBaseClient, "get_activity", side_effect=fake_get_activity
+            ):
+                points = client.iter_full_activity(
+                    {"from_date": "2024-01-01", "to_date": "2024-01-31"}
+                )
+                async for point in points:
+                    await asyncio.sleep(0)  # Let the prefetch start
+                    break
+                await points.aclose()
+                await asyncio.sleep(0)
+            # Checked before asyncio.run() cancels any tasks still left on shutdown
+            return point, list(cancelled)
+
+        point, cancelled_before_shutdown = asyncio.run(run())
+        assert point == {"id": 1}
+        assert cancelled_before_shutdown == ["1"]
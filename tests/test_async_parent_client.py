@@ -0,0 +1,102 @@
+"""Tests for AsyncParentClient."""
+
+import asyncio
+import json
+from http.cookies import SimpleCookie
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pyclasscharts.async_parent_client import AsyncParentClient  # noqa: E402
+from pyclasscharts.exceptions import APIError, AuthenticationError, ValidationError  # noqa: E402
+
+
+def mock_login_post(status, cookies=None):
+    """Build a mock for aiohttp.ClientSession.post returning a login response."""
+    response = MagicMock(status=status)
+    response.headers = {"set-cookie": "..."} if cookies else {}
+    response.cookies = SimpleCookie()
+    for name, value in (cookies or {}).items():
+        response.cookies[name] = value
+    post = MagicMock()
+    post.return_value.__aenter__.return_value = response
+    return post
+
+
+async def login(client, post):
+    """Log the client in with the given mocked login POST."""
+    async with client:
+        with patch.object(client._get_session(), "post", post):
+            await client.login()
+
+
+class TestAsyncParentClient:
+    """Test cases for AsyncParentClient."""
+
+    def test_throws_when_no_email_provided(self):
+        """Test that login raises ValidationError when no email is provided."""
+        client = AsyncParentClient("", "password")
+        with pytest.raises(ValidationError, match="Email not provided"):
+            asyncio.run(client.login())
+
+    def test_throws_with_invalid_username_and_password(self):
+        """Test that login raises AuthenticationError with invalid credentials."""
+        client = AsyncParentClient("invalid", "invalid")
+        with pytest.raises(
+            AuthenticationError,
+            match="Unauthenticated: ClassCharts didn't return authentication cookies",
+        ):
+            asyncio.run(login(client, mock_login_post(200)))
+
+    @patch.object(AsyncParentClient, "get_pupils", new_callable=AsyncMock)
+    def test_login_success(self, mock_get_pupils):
+        """Test successful login flow."""
+        mock_get_pupils.return_value = [{"id": 123, "name": "Test Pupil"}]
+        post = mock_login_post(
+            302,
+            {"parent_session_credentials": json.dumps({"session_id": "test_session_id"})},
+        )
+
+        client = AsyncParentClient("email@example.com", "password")
+        asyncio.run(login(client, post))
+
+        assert client.session_id == "test_session_id"
+        assert client.student_id == 123
+
+    def test_select_pupil_success(self):
+        """Test selecting a pupil by ID."""
+        client = AsyncParentClient("email", "password")
+        client.pupils = [
+            {"id": 1, "name": "Pupil 1"},
+            {"id": 2, "name": "Pupil 2"},
+        ]
+
+        client.select_pupil(2)
+        assert client.student_id == 2
+
+    def test_fetch_all(self):
+        """Test that every pupil's endpoints are fetched, keeping failures per request."""
+
+        async def fake_request(path, method="GET", **kwargs):
+            if path.endswith("/detentions/2"):
+                raise APIError("Detentions disabled")
+            return {"success": 1, "data": path, "meta": {}}
+
+        async def run():
+            client = AsyncParentClient("email", "password")
+            client.pupils = [{"id": 1}, {"id": 2}]
+            client.student_id = 1
+            with patch.object(AsyncParentClient, "_make_authed_request", side_effect=fake_request):
+                results = await client.fetch_all(max_concurrency=2)
+            return client, results
+
+        client, results = asyncio.run(run())
+        assert len(results) == 10
+        assert (
+            results[(2, "homeworks")]["data"]
+            == "https://www.classcharts.com/apiv2parent/homeworks/2"
+        )
+        assert isinstance(results[(2, "detentions")], APIError)
+        assert client.student_id == 1
@@ -0,0 +1,104 @@
+"""Tests for AsyncStudentClient."""
+
+import asyncio
+import json
+from http.cookies import SimpleCookie
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import quote
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pyclasscharts.async_student_client import AsyncStudentClient  # noqa: E402
+from pyclasscharts.consts import API_BASE_STUDENT, BASE_URL  # noqa: E402
+from pyclasscharts.exceptions import AuthenticationError, ValidationError  # noqa: E402
+
+
+def mock_login_post(status, cookies=None):
+    """Build a mock for aiohttp.ClientSession.post returning a login response."""
+    response = MagicMock(status=status)
+    response.headers = {"set-cookie": "..."} if cookies else {}
+    response.cookies = SimpleCookie()
+    for name, value in (cookies or {}).items():
+        response.cookies[name] = value
+    post = MagicMock()
+    post.return_value.__aenter__.return_value = response
+    return post
+
+
+async def login(client, post):
+    """Log the client in with the given mocked login POST."""
+    async with client:
+        with patch.object(client._get_session(), "post", post):
+            await client.login()
+
+
+class TestAsyncStudentClient:
+    """Test cases for AsyncStudentClient."""
+
+    def test_throws_when_no_student_code_provided(self):
+        """Test that login raises ValidationError when no student code is provided."""
+        client = AsyncStudentClient("", "01/01/2000")
+        with pytest.raises(ValidationError, match="Student Code not provided"):
+            asyncio.run(client.login())
+
+    def test_throws_with_invalid_code_and_date_of_birth(self):
+        """Test that login raises AuthenticationError with invalid credentials."""
+        client = AsyncStudentClient("invalid", "01/01/2000")
+        with pytest.raises(
+            AuthenticationError,
+            match="Unauthenticated: ClassCharts didn't return authentication cookies",
+        ):
+            asyncio.run(login(client, mock_login_post(200)))
+
+    def test_throws_without_credentials_cookie(self):
+        """Test that login raises AuthenticationError when the credentials cookie is missing."""
+        client = AsyncStudentClient("abc123", "01/01/2000")
+        with pytest.raises(AuthenticationError, match="Failed to extract session credentials"):
+            asyncio.run(login(client, mock_login_post(302, {"other_cookie": "value"})))
+
+    @patch.object(AsyncStudentClient, "_make_authed_request", new_callable=AsyncMock)
+    def test_login_success(self, mock_request):
+        """Test that login reads the student from the ping, without a separate info request."""
+        mock_request.return_value = {
+            "success": 1,
+            "data": {"user": {"id": 123}},
+            "meta": {"session_id": "pinged_session_id"},
+        }
+        credentials = json.dumps({"session_id": "test_session_id"})
+        post = mock_login_post(302, {"student_session_credentials": quote(credentials)})
+
+        client = AsyncStudentClient("abc123", "01/01/2000")
+        asyncio.run(login(client, post))
+
+        assert post.call_args.args == (f"{BASE_URL}/student/login",)
+        assert post.call_args.kwargs["data"]["code"] == "ABC123"
+        mock_request.assert_awaited_once()
+        assert mock_request.call_args.args == (f"{API_BASE_STUDENT}/ping",)
+        assert client.session_id == "pinged_session_id"
+        assert client.student_id == 123
+
+    @patch.object(AsyncStudentClient, "_make_authed_request", new_callable=AsyncMock)
+    def test_get_rewards(self, mock_request):
+        """Test that rewards are fetched from the current student's rewards route."""
+        mock_request.return_value = {"success": 1, "data": [], "meta": {}}
+        client = AsyncStudentClient("abc123", "01/01/2000")
+        client.student_id = 123
+
+        asyncio.run(client.get_rewards())
+
+        mock_request.assert_awaited_once_with(f"{API_BASE_STUDENT}/rewards/123", method="GET")
+
+    @patch.object(AsyncStudentClient, "_make_authed_request", new_callable=AsyncMock)
+    def test_purchase_reward(self, mock_request):
+        """Test that purchasing a reward posts the current student's ID."""
+        mock_request.return_value = {"success": 1, "data": {}, "meta": {}}
+        client = AsyncStudentClient("abc123", "01/01/2000")
+        client.student_id = 123
+
+        asyncio.run(client.purchase_reward(7))
+
+        assert mock_request.call_args.args == (f"{API_BASE_STUDENT}/purchase/7",)
+        assert mock_request.call_args.kwargs["method"] == "POST"
+        assert mock_request.call_args.kwargs["data"] == "pupil_id=123"
@@ -1,12 +1,20 @@
 """Tests for BaseClient."""
 
+import json
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
+import responses
+from urllib3 import HTTPResponse
 
+from pyclasscharts._client_state import _build_query, _cache_key
 from pyclasscharts.base_client import BaseClient
-from pyclasscharts.exceptions import APIError, NoSessionError
+from pyclasscharts.consts import ERROR_BODY_LIMIT, ETAG_CACHE_SIZE
+from pyclasscharts.exceptions import APIError, NoSessionError, RateLimitError
+
+ENDPOINT = "https://test.api/endpoint"
+OK = {"success": 1, "data": {}, "meta": {}}
 
 
 class ConcreteBaseClient(BaseClient):
@@ -18,7 +26,7 @@ class ConcreteBaseClient(BaseClient):
     def login(self):
         """Mock login implementation."""
         self.session_id = "test_session"
-        self.last_ping = time.time() * 1000
+        self.last_ping = time.monotonic()
 
 
 class TestBaseClient:
@@ -32,69 +40,117 @@ class TestBaseClient:
         with pytest.raises(NoSessionError, match="No session ID"):
             client._make_authed_request("https://test.api/endpoint")
 
-    def test_api_error_on_failed_response(self):
+    def test_api_error_on_failed_response(self, http):
         """Test that API errors are raised when success is 0."""
         client = ConcreteBaseClient()
         client.login()
+        http.add(
+            responses.GET,
+            ENDPOINT,
+            json={"success": 0, "error": "Test error message", "data": {}, "meta": {}},
+        )
 
-        with patch.object(client._session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                "success": 0,
-                "error": "Test error message",
-                "data": {},
-                "meta": {},
-            }
-            mock_response.text = '{"success": 0, "error": "Test error message"}'
-            mock_request.return_value = mock_response
-
-            with pytest.raises(APIError, match="Test error message"):
-                client._make_authed_request("https://test.api/endpoint")
+        with pytest.raises(APIError, match="Test error message"):
+            client._make_authed_request(ENDPOINT)
 
-    def test_json_decode_error(self):
+    def test_json_decode_error(self, http):
         """Test that JSON decode errors are handled properly."""
-        import json
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, body="Not JSON")
+
+        with pytest.raises(APIError, match="Error parsing JSON"):
+            client._make_authed_request(ENDPOINT)
+
+    def test_json_decode_error_truncates_body(self, http):
+        """Test that only the start of an unparseable body is included in the error."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, body="x" * 10_000)
 
+        with pytest.raises(APIError) as exc_info:
+            client._make_authed_request(ENDPOINT)
+
+        assert str(exc_info.value).endswith(": " + "x" * ERROR_BODY_LIMIT)
+
+    @patch("pyclasscharts._client_state.json_loads", json.loads)
+    def test_json_decode_error_without_orjson(self, http):
+        """Test that decode errors from the stdlib fallback are handled too."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, body="Not JSON")
+
+        with pytest.raises(APIError, match="Error parsing JSON"):
+            client._make_authed_request(ENDPOINT)
+
+    def test_rate_limited_response(self, http):
+        """Test that a 429 raises RateLimitError straight away, without retrying."""
         client = ConcreteBaseClient()
         client.login()
+        http.add(responses.GET, ENDPOINT, status=429, headers={"Retry-After": "30"}, body="<html>")
 
-        with patch.object(client._session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "Not JSON", 0)
-            mock_response.text = "Not JSON"
-            mock_request.return_value = mock_response
+        with pytest.raises(RateLimitError, match="retry after 30s") as exc_info:
+            client._make_authed_request(ENDPOINT)
 
-            with pytest.raises(APIError, match="Error parsing JSON"):
-                client._make_authed_request("https://test.api/endpoint")
+        assert exc_info.value.retry_after == 30
+        assert len(http.calls) == 1
+
+    @patch("time.sleep")
+    def test_retries_ignore_retry_after(self, mock_sleep):
+        """Test that GET retries never block on the server's Retry-After."""
+        retry = ConcreteBaseClient()._session.get_adapter(ENDPOINT).max_retries
+
+        assert not retry.is_retry("GET", 429, has_retry_after=True)
+        assert retry.is_retry("GET", 503, has_retry_after=True)
+        retry.increment("GET", ENDPOINT).sleep(
+            HTTPResponse(status=503, headers={"Retry-After": "3600"})
+        )
+        assert all(call.args[0] < 1 for call in mock_sleep.call_args_list)
+
+    def test_upstream_error_response(self, http):
+        """Test that 5xx responses raise APIError without decoding the body."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.POST, ENDPOINT, status=503, body="<html>")
 
-    def test_session_revalidation(self):
+        with pytest.raises(APIError, match="Upstream error 503"):
+            client._make_authed_request(ENDPOINT, method="POST")
+
+        assert len(http.calls) == 1  # POSTs are never retried
+
+    def test_session_revalidation(self, http):
         """Test that session ID is revalidated when it's old."""
         client = ConcreteBaseClient()
         client.login()
         # Set last_ping to be old (more than 3 minutes ago)
-        client.last_ping = time.time() * 1000 - 200000  # ~3.3 minutes ago
+        client.last_ping = time.monotonic() - 200  # ~3.3 minutes ago
+        http.add(responses.GET, ENDPOINT, json=OK)
+
+        with patch.object(ConcreteBaseClient, "get_new_session_id") as mock_revalidate:
+            client._make_authed_request(ENDPOINT)
 
-        with patch.object(client, "get_new_session_id") as mock_revalidate:
-            with patch.object(client._session, "request") as mock_request:
-                mock_response = Mock()
-                mock_response.json.return_value = {
-                    "success": 1,
-                    "data": {},
-                    "meta": {},
-                }
-                mock_request.return_value = mock_response
+            # Should have called get_new_session_id
+            mock_revalidate.assert_called_once()
+
+    def test_no_revalidation_while_fresh_or_never_pinged(self, http):
+        """Test that the session isn't revalidated before the ping interval runs out."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json=OK)
 
-                client._make_authed_request("https://test.api/endpoint")
+        with patch.object(ConcreteBaseClient, "get_new_session_id") as mock_revalidate:
+            client._make_authed_request(ENDPOINT, params={"a": "1"})
+            client.last_ping = 0.0
+            client._make_authed_request(ENDPOINT, params={"a": "2"})
 
-                # Should have called get_new_session_id
-                mock_revalidate.assert_called_once()
+            mock_revalidate.assert_not_called()
 
     def test_get_new_session_id(self):
         """Test that get_new_session_id updates session ID."""
         client = ConcreteBaseClient()
         client.login()
 
-        with patch.object(client, "_make_authed_request") as mock_request:
+        with patch.object(ConcreteBaseClient, "_make_authed_request") as mock_request:
             mock_request.return_value = {
                 "meta": {"session_id": "new_session_id"},
                 "data": {},
@@ -105,3 +161,173 @@ class TestBaseClient:
 
             assert client.session_id == "new_session_id"
             assert client.last_ping > 0
+
+    def test_session_adapter_retries_gets(self):
+        """Test that the session adapter retries GETs but not POSTs."""
+        client = ConcreteBaseClient()
+        adapter = client._session.get_adapter("https://www.classcharts.com")
+
+        assert adapter.max_retries.total == 3
+        assert "GET" in adapter.max_retries.allowed_methods
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert 429 not in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.raise_on_status is False
+        assert adapter._pool_maxsize == 32
+
+    def test_get_responses_are_cached(self, http):
+        """Test that repeated GETs are served from the cache until invalidated."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json=OK)
+
+        client._make_authed_request(ENDPOINT, params={"a": "1"})
+        client._make_authed_request(ENDPOINT, params={"a": "1"})
+        assert len(http.calls) == 1
+
+        client._make_authed_request(ENDPOINT, params={"a": "2"})
+        assert len(http.calls) == 2
+
+        client.invalidate_cache()
+        client._make_authed_request(ENDPOINT, params={"a": "1"})
+        assert len(http.calls) == 3
+
+    def test_post_responses_are_not_cached(self, http):
+        """Test that POST requests always hit the API."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.POST, ENDPOINT, json=OK)
+
+        client._make_authed_request(ENDPOINT, method="POST")
+        client._make_authed_request(ENDPOINT, method="POST")
+        assert len(http.calls) == 2
+
+    def test_posts_invalidate_cached_responses(self, http):
+        """Test that a write such as a purchase isn't followed by stale cached GETs."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json=OK)
+        http.add(responses.POST, "https://test.api/purchase", json=OK)
+        http.add(responses.POST, "https://test.api/ping", json=OK)
+
+        client._make_authed_request(ENDPOINT)
+        client._make_authed_request("https://test.api/ping", method="POST")
+        client._make_authed_request(ENDPOINT)
+        assert len(http.calls) == 2  # Pings don't invalidate the cache
+
+        client._make_authed_request("https://test.api/purchase", method="POST")
+        client._make_authed_request(ENDPOINT)
+        assert len(http.calls) == 4
+
+    def test_cached_responses_are_not_shared(self, http):
+        """Test that changing a returned response doesn't change the cached one."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json={**OK, "data": {"balance": 10}})
+
+        client._make_authed_request(ENDPOINT)["data"]["balance"] = 0
+
+        assert client._make_authed_request(ENDPOINT)["data"] == {"balance": 10}
+        assert len(http.calls) == 1
+
+    def test_conditional_get_reuses_unchanged_response(self, http):
+        """Test that a GET with a known ETag is conditional and a 304 reuses the response."""
+        client = ConcreteBaseClient()
+        client.login()
+        client.cache_ttl = 0
+        http.add(responses.GET, ENDPOINT, json={**OK, "data": [1]}, headers={"ETag": '"v1"'})
+        http.add(responses.GET, ENDPOINT, status=304)
+
+        first = client._make_authed_request(ENDPOINT)
+        second = client._make_authed_request(ENDPOINT)
+
+        assert "If-None-Match" not in http.calls[0].request.headers
+        assert http.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert second == first == {**OK, "data": [1]}
+
+    def test_etag_cache_is_bounded(self, http):
+        """Test that only the most recent ETags are kept."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json=OK, headers={"ETag": '"v1"'})
+
+        for i in range(ETAG_CACHE_SIZE + 1):
+            client._make_authed_request(ENDPOINT, params={"page": str(i)})
+
+        assert len(client._etags) == ETAG_CACHE_SIZE
+        assert _cache_key(ENDPOINT, {"page": "0"}) not in client._etags
+
+    def test_requests_send_auth_header(self, http):
+        """Test that requests carry the session's Authorization header."""
+        client = ConcreteBaseClient()
+        client.login()
+        http.add(responses.GET, ENDPOINT, json=OK)
+
+        client._make_authed_request(ENDPOINT)
+        assert http.calls[0].request.headers["Authorization"] == "Basic test_session"
+
+    def test_authed_headers_follow_session_id(self):
+        """Test that the pre-built auth headers are rebuilt when the session ID changes."""
+        client = ConcreteBaseClient()
+        client.session_id = "abc"
+        assert client._authed_headers == {"Authorization": "Basic abc"}
+
+        client.session_id = "def"
+        assert client._authed_headers == {"Authorization": "Basic def"}
+
+    def test_endpoints_follow_student_id(self):
+        """Test that per-student endpoint URLs are rebuilt when the student changes."""
+        client = ConcreteBaseClient()
+        client.student_id = 42
+
+        assert client._endpoints["timetable"] == "https://test.api/timetable/42"
+        assert client._endpoints["customfields"] == "https://test.api/customfields/42"
+
+    def test_get_full_activity_paginates(self):
+        """Test that get_full_activity follows last_id until an empty page."""
+        pages = {
+            None: [{"id": 1}, {"id": 2}],
+            "2": [{"id": 3}],
+            "3": [],
+        }
+        client = ConcreteBaseClient()
+
+        with patch.object(ConcreteBaseClient, "get_activity") as mock_get_activity:
+            mock_get_activity.side_effect = lambda options: {
+                "success": 1,
+                "data": pages[options.get("last_id")],
+                "meta": {},
+            }
+            activity = client.get_full_activity(
+                {"from_date": "2024-01-01", "to_date": "2024-01-31"}
+            )
+
+        assert activity == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert mock_get_activity.call_count == 3
+
+    def test_iter_full_activity_fetches_pages_lazily(self):
+        """Test that iter_full_activity only fetches pages as they are reached."""
+        client = ConcreteBaseClient()
+
+        with patch.object(ConcreteBaseClient, "get_activity") as mock_get_activity:
+            mock_get_activity.return_value = {"success": 1, "data": [{"id": 1}], "meta": {}}
+            points = client.iter_full_activity({"from_date": "2024-01-01", "to_date": "2024-01-31"})
+            assert mock_get_activity.call_count == 0
+
+            assert next(points) == {"id": 1}
+            assert mock_get_activity.call_count == 1
+
+
+class TestBuildQuery:
+    """Test cases for the _build_query helper."""
+
+    def test_renames_and_filters_options(self):
+        """Test that options are renamed to query params and unknown keys are dropped."""
+        options = {"from_date": "2024-01-01", "to_date": "2024-01-31", "display_date": "due_date"}
+        assert _build_query(options, "from_date", "to_date") == {
+            "from": "2024-01-01",
+            "to": "2024-01-31",
+        }
+
+    def test_no_options(self):
+        """Test that missing options produce no query params."""
+        assert _build_query(None, "from_date", "to_date") == {}
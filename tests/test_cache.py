@@ -0,0 +1,52 @@
+"""Tests for TTLCache."""
+
+from pyclasscharts._cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_until_expired(self):
+        """Test that values are returned until their TTL runs out."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.put("a", 1, ttl=10, now=100.0)
+
+        assert cache.get("a", now=105.0) == 1
+        assert cache.get("a", now=110.0) is None
+        assert cache.get("missing", now=100.0) is None
+        assert len(cache) == 0
+
+    def test_entries_have_their_own_ttl(self):
+        """Test that each entry expires after its own TTL."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.put("short", 1, ttl=1, now=0.0)
+        cache.put("long", 2, ttl=100, now=0.0)
+
+        assert cache.get("short", now=50.0) is None
+        assert cache.get("long", now=50.0) == 2
+
+    def test_put_purges_expired_entries(self):
+        """Test that expired entries are dropped without being read."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.put("a", 1, ttl=1, now=0.0)
+        cache.put("b", 2, ttl=1, now=0.0)
+        cache.put("c", 3, ttl=1, now=5.0)
+
+        assert len(cache) == 1
+
+    def test_overwritten_entry_keeps_new_expiry(self):
+        """Test that purging an old expiry doesn't drop a newer value for the key."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.put("a", 1, ttl=1, now=0.0)
+        cache.put("a", 2, ttl=100, now=0.5)
+        cache.put("b", 3, ttl=1, now=5.0)
+
+        assert cache.get("a", now=5.0) == 2
+
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.put("a", 1, ttl=10)
+        cache.clear()
+
+        assert cache.get("a") is None
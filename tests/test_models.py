@@ -0,0 +1,72 @@
+"""Tests for the attribute-access models."""
+
+import dataclasses
+import json
+import sys
+from typing import get_args, get_type_hints
+
+import pytest
+
+from pyclasscharts import types
+from pyclasscharts.models import ActivityPoint, Detention, Homework, Lesson, _Model
+
+
+class TestModels:
+    """Test cases for the models."""
+
+    def test_from_api_reads_fields(self):
+        """Test that API keys map to attributes and unknown keys are ignored."""
+        point = ActivityPoint.from_api(
+            {"id": 1, "type": "behaviour", "score": 2, "_can_delete": False, "extra": "x"}
+        )
+        assert point.id == 1
+        assert point.type == "behaviour"
+        assert point.score == 2
+        assert point._can_delete is False
+
+    def test_missing_keys_are_none(self):
+        """Test that keys missing from the API data are set to None."""
+        detention = Detention.from_api({"id": 5})
+        assert detention.id == 5
+        assert detention.lesson is None
+
+    def test_from_api_generated_for_each_model(self):
+        """Test that each model defines its own from_api, with no base stub to inherit."""
+        assert not hasattr(_Model, "from_api")
+        for model in (ActivityPoint, Detention, Homework, Lesson):
+            assert "from_api" in vars(model)
+
+    def test_from_api_list(self):
+        """Test building models from a response's data list."""
+        lessons = Lesson.from_api_list([{"key": 1}, {"key": 2}])
+        assert [lesson.key for lesson in lessons] == [1, 2]
+
+    def test_models_are_frozen(self):
+        """Test that models can't be modified."""
+        homework = Homework.from_api({"id": 1})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            homework.id = 2  # type: ignore[misc]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_models_are_slotted(self):
+        """Test that models don't carry a per-instance __dict__."""
+        assert not hasattr(Homework.from_api({}), "__dict__")
+
+    def test_vocabulary_values_are_shared(self):
+        """Test that fixed-vocabulary values decode to one shared string."""
+        items = json.loads('[{"attended": "yes"}, {"attended": "yes"}, {"attended": null}]')
+        first, second, third = Detention.from_api_list(items)
+
+        assert first.attended == "yes"
+        assert first.attended is second.attended
+        assert third.attended is None
+
+    def test_vocabulary_sets_match_literal_types(self):
+        """Test that the exported value sets match the TypedDict Literal types."""
+        activity = get_type_hints(types.ActivityPoint)
+        polarity = next(arg for arg in get_args(activity["polarity"]) if arg is not type(None))
+        detention = get_type_hints(types.Detention)
+
+        assert set(get_args(activity["type"])) == types.ACTIVITY_TYPES
+        assert set(get_args(polarity)) == types.ACTIVITY_POLARITIES
+        assert set(get_args(detention["attended"])) == types.ATTENDED_STATES
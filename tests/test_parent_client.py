@@ -1,12 +1,18 @@
 """Tests for ParentClient."""
 
-from unittest.mock import Mock, patch
+import json
+from urllib.parse import quote
 
 import pytest
+import responses
 
+from pyclasscharts.consts import API_BASE_PARENT, BASE_URL
 from pyclasscharts.exceptions import AuthenticationError, ValidationError
 from pyclasscharts.parent_client import ParentClient
 
+LOGIN_URL = f"{BASE_URL}/parent/login"
+PUPILS_URL = f"{API_BASE_PARENT}/pupils"
+
 
 class TestParentClient:
     """Test cases for ParentClient."""
@@ -23,14 +29,10 @@ class TestParentClient:
         with pytest.raises(ValidationError, match="Password not provided"):
             client.login()
 
-    @patch("pyclasscharts.parent_client.requests.post")
-    def test_throws_with_invalid_username_and_password(self, mock_post):
+    def test_throws_with_invalid_username_and_password(self, http):
         """Test that login raises AuthenticationError with invalid credentials."""
-        # Mock a response that doesn't have set-cookie header (failed auth)
-        mock_response = Mock()
-        mock_response.status_code = 200  # Not a redirect
-        mock_response.headers = {}  # No set-cookie header
-        mock_post.return_value = mock_response
+        # A failed login renders the login page again instead of redirecting
+        http.add(responses.POST, LOGIN_URL, status=200, body="<html>")
 
         client = ParentClient("invalid", "invalid")
         with pytest.raises(
@@ -39,13 +41,9 @@ class TestParentClient:
         ):
             client.login()
 
-    @patch("pyclasscharts.parent_client.requests.post")
-    def test_throws_when_no_set_cookie_header(self, mock_post):
+    def test_throws_when_no_set_cookie_header(self, http):
         """Test that login raises AuthenticationError when no set-cookie header."""
-        mock_response = Mock()
-        mock_response.status_code = 302  # Redirect
-        mock_response.headers = {}  # No set-cookie header
-        mock_post.return_value = mock_response
+        http.add(responses.POST, LOGIN_URL, status=302)
 
         client = ParentClient("email", "password")
         with pytest.raises(
@@ -54,35 +52,44 @@ class TestParentClient:
         ):
             client.login()
 
-    @patch("pyclasscharts.parent_client.requests.post")
-    @patch("pyclasscharts.parent_client.ParentClient.get_pupils")
-    @patch("pyclasscharts.parent_client.parse_cookies")
-    def test_login_success(self, mock_parse_cookies, mock_get_pupils, mock_post):
-        """Test successful login flow."""
-        import json
-
-        # Mock successful login response
-        mock_response = Mock()
-        mock_response.status_code = 302
-        mock_response.headers = {
-            "set-cookie": "parent_session_credentials="
-            + json.dumps({"session_id": "test_session_id"})
-        }
-        mock_post.return_value = mock_response
+    def test_throws_with_malformed_credentials_cookie(self, http):
+        """Test that login raises AuthenticationError when the credentials aren't valid JSON."""
+        http.add(
+            responses.POST,
+            LOGIN_URL,
+            status=302,
+            headers={"Set-Cookie": "parent_session_credentials=not-json; path=/"},
+        )
 
-        # Mock cookie parsing
-        mock_parse_cookies.return_value = {
-            "parent_session_credentials": json.dumps({"session_id": "test_session_id"})
-        }
+        client = ParentClient("email", "password")
+        with pytest.raises(AuthenticationError, match="Failed to parse session credentials"):
+            client.login()
 
-        # Mock get_pupils to return a pupil
-        mock_get_pupils.return_value = [{"id": 123, "name": "Test Pupil"}]
+    def test_login_success(self, http):
+        """Test successful login flow."""
+        credentials = quote(json.dumps({"session_id": "test_session_id"}))
+        http.add(
+            responses.POST,
+            LOGIN_URL,
+            status=302,
+            headers={"Set-Cookie": f"parent_session_credentials={credentials}; path=/"},
+        )
+        http.add(
+            responses.GET,
+            PUPILS_URL,
+            json={"success": 1, "data": [{"id": 123, "name": "Test Pupil"}], "meta": {}},
+        )
 
         client = ParentClient("email@example.com", "password")
         client.login()
 
         assert client.session_id == "test_session_id"
         assert client.student_id == 123
+        assert http.calls[1].request.headers["Authorization"] == "Basic test_session_id"
+
+    def test_client_is_slotted(self):
+        """Test that client instances don't carry a per-instance __dict__."""
+        assert not hasattr(ParentClient("email", "password"), "__dict__")
 
     def test_select_pupil_success(self):
         """Test selecting a pupil by ID."""
@@ -104,6 +111,17 @@ class TestParentClient:
         with pytest.raises(ValidationError, match="No pupil with specified ID found"):
             client.select_pupil(999)
 
+    def test_select_pupil_after_pupils_replaced(self):
+        """Test that the pupil index follows reassignment of pupils."""
+        client = ParentClient("email", "password")
+        client.pupils = [{"id": 1, "name": "Pupil 1"}]
+        client.pupils = [{"id": 3, "name": "Pupil 3"}]
+
+        client.select_pupil(3)
+        assert client.student_id == 3
+        with pytest.raises(ValidationError, match="No pupil with specified ID found"):
+            client.select_pupil(1)
+
     def test_select_pupil_no_id(self):
         """Test that selecting with no ID raises ValidationError."""
         client = ParentClient("email", "password")
@@ -111,3 +129,18 @@ class TestParentClient:
 
         with pytest.raises(ValidationError, match="No pupil ID specified"):
             client.select_pupil(0)
+
+    def test_get_pupils_is_cached_until_session_changes(self, http):
+        """Test that the pupil list is reused until the session ID changes."""
+        client = ParentClient("email", "password")
+        client.session_id = "session"
+
+        http.add(responses.GET, PUPILS_URL, json={"success": 1, "data": [{"id": 1}], "meta": {}})
+
+        assert client.get_pupils() == [{"id": 1}]
+        assert client.get_pupils() == [{"id": 1}]
+        assert len(http.calls) == 1
+
+        client.session_id = "new_session"
+        client.get_pupils()
+        assert len(http.calls) == 2
@@ -0,0 +1,137 @@
+"""Tests for rate limiting helpers."""
+
+import asyncio
+import threading
+import time
+
+from pyclasscharts.ratelimit import (
+    BACKOFF_INITIAL_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    RateLimiter,
+    backoff_delay,
+    get_limiter,
+)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_update_pauses_for_retry_after(self):
+        """Test that Retry-After holds back new requests."""
+        limiter = RateLimiter()
+        assert limiter.update({"Retry-After": "5"}) == 5.0
+        assert limiter._resume_at > time.monotonic() + 4
+
+    def test_update_caps_long_retry_after(self):
+        """Test that a long Retry-After pauses for at most BACKOFF_MAX_SECONDS."""
+        limiter = RateLimiter()
+        assert limiter.update({"Retry-After": "3600"}) == 3600.0
+        assert limiter._resume_at <= time.monotonic() + BACKOFF_MAX_SECONDS
+
+    def test_update_pauses_when_no_requests_remain(self):
+        """Test that an exhausted X-RateLimit-Remaining holds back new requests."""
+        limiter = RateLimiter()
+        assert limiter.update({"X-RateLimit-Remaining": "0"}) is None
+        assert limiter._resume_at > time.monotonic()
+
+    def test_update_without_headers(self):
+        """Test that responses without rate limit headers don't pause."""
+        limiter = RateLimiter()
+        assert limiter.update({"X-RateLimit-Remaining": "10"}) is None
+        assert limiter._resume_at == 0.0
+
+    def test_limits_concurrency(self):
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = RateLimiter(max_concurrency=2)
+        active = peak = 0
+
+        async def request():
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        # Run twice to check the limiter can be reused from a new event loop
+        asyncio.run(run())
+        asyncio.run(run())
+        assert peak == 2
+
+    def test_limits_concurrency_per_loop_across_threads(self):
+        """Test that event loops in different threads each get their own limit."""
+        limiter = RateLimiter(max_concurrency=2)
+        peaks = {}
+
+        def run_loop(name):
+            active = peak = 0
+
+            async def request():
+                nonlocal active, peak
+                async with limiter:
+                    active += 1
+                    peak = max(peak, active)
+                    await asyncio.sleep(0.005)
+                    active -= 1
+
+            async def run():
+                await asyncio.gather(*(request() for _ in range(12)))
+
+            asyncio.run(run())
+            peaks[name] = peak
+
+        threads = [threading.Thread(target=run_loop, args=(name,), daemon=True) for name in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive(), "requests deadlocked on another loop's semaphore"
+        assert peaks == {"a": 2, "b": 2}
+
+    def test_cancelled_during_pause_releases_slot(self):
+        """Test that a request cancelled while waiting out a pause frees its slot."""
+        limiter = RateLimiter(max_concurrency=2)
+        limiter.pause(5)
+
+        async def request():
+            async with limiter:
+                pass
+
+        async def run():
+            tasks = [asyncio.create_task(request()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            semaphore = limiter._get_semaphore()
+            assert not semaphore.locked()
+            limiter._resume_at = 0.0
+            await asyncio.wait_for(request(), timeout=1)
+
+        asyncio.run(run())
+
+    def test_get_limiter_is_shared_per_host(self):
+        """Test that clients talking to the same host share a limiter."""
+        assert get_limiter("example.com") is get_limiter("example.com")
+        assert get_limiter("example.com") is not get_limiter("example.org")
+
+
+class TestBackoffDelay:
+    """Test cases for backoff_delay."""
+
+    def test_uses_retry_after(self):
+        """Test that the server's delay is used when given."""
+        assert backoff_delay(3, retry_after=2.0) == 2.0
+
+    def test_caps_retry_after(self):
+        """Test that a long server delay is capped."""
+        assert backoff_delay(0, retry_after=3600.0) == BACKOFF_MAX_SECONDS
+
+    def test_grows_exponentially_up_to_max(self):
+        """Test that the delay doubles with each attempt and is capped."""
+        assert BACKOFF_INITIAL_SECONDS <= backoff_delay(0) <= 2 * BACKOFF_INITIAL_SECONDS
+        assert 4 * BACKOFF_INITIAL_SECONDS <= backoff_delay(2) <= 5 * BACKOFF_INITIAL_SECONDS
+        assert backoff_delay(20) <= BACKOFF_MAX_SECONDS + BACKOFF_INITIAL_SECONDS
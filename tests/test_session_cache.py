@@ -0,0 +1,71 @@
+"""Tests for SessionCache."""
+
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from pyclasscharts.parent_client import ParentClient
+from pyclasscharts.session_cache import SessionCache
+
+
+class TestSessionCache:
+    """Test cases for SessionCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored session is returned while fresh."""
+        cache = SessionCache(str(tmp_path / "sessions"))
+        cache.set("email@example.com", "session", {"a": "1"})
+
+        cached = cache.get("email@example.com")
+        assert cached is not None
+        assert cached["session_id"] == "session"
+        assert cached["cookies"] == {"a": "1"}
+        assert cache.get("other@example.com") is None
+
+    def test_expired_session_is_ignored(self, tmp_path):
+        """Test that sessions older than the TTL are not reused."""
+        cache = SessionCache(str(tmp_path / "sessions"), ttl=0)
+        cache.set("email@example.com", "session", {})
+
+        assert cache.get("email@example.com") is None
+
+    def test_delete(self, tmp_path):
+        """Test that deleted sessions are no longer returned."""
+        cache = SessionCache(str(tmp_path / "sessions"))
+        cache.set("email@example.com", "session", {})
+        cache.delete("email@example.com")
+
+        assert cache.get("email@example.com") is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_cache_is_private_to_the_user(self, tmp_path):
+        """Test that the cached credentials can only be read by their owner."""
+        directory = tmp_path / "pyclasscharts"
+        cache = SessionCache(str(directory / "sessions"))
+        cache.set("email@example.com", "session", {"a": "1"})
+
+        assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
+        for name in os.listdir(directory):
+            assert stat.S_IMODE(os.stat(directory / name).st_mode) & 0o077 == 0
+
+    @patch("pyclasscharts.parent_client.ParentClient.get_pupils")
+    @patch("pyclasscharts.parent_client.ParentClient.get_new_session_id")
+    @patch("requests.Session.post")
+    def test_login_resumes_cached_session(
+        self, mock_post, mock_get_new_session_id, mock_get_pupils, tmp_path
+    ):
+        """Test that login skips the credential handshake when a fresh session is cached."""
+        cache = SessionCache(str(tmp_path / "sessions"))
+        cache.set("email@example.com", "cached_session_id", {})
+        mock_get_pupils.return_value = [{"id": 123, "name": "Test Pupil"}]
+
+        client = ParentClient("email@example.com", "password", session_cache=cache)
+        client.login()
+
+        mock_post.assert_not_called()
+        mock_get_new_session_id.assert_called_once()
+        assert client.session_id == "cached_session_id"
+        assert client.student_id == 123
@@ -0,0 +1,38 @@
+"""Tests for StudentClient login failures."""
+
+import re
+
+import pytest
+
+from pyclasscharts.exceptions import AuthenticationError, ValidationError
+from pyclasscharts.student_client import StudentClient
+
+_AUTH_ERR_RE = re.compile("Unauthenticated: ClassCharts didn't return authentication cookies")
+
+
+class TestStudentClientErrors:
+    """Test cases for StudentClient login failures."""
+
+    def test_throws_when_no_student_code_provided(self):
+        """Test that login raises ValidationError when no student code is provided."""
+        client = StudentClient("")
+        with pytest.raises(ValidationError, match="Student Code not provided"):
+            client.login()
+
+    def test_throws_with_invalid_student_code(self, login_mocks, login_response):
+        """Test that login raises AuthenticationError with invalid student code."""
+        # Failed auth: no redirect or set-cookie header
+        login_mocks.post.return_value = login_response(200, {})
+
+        client = StudentClient("invalid")
+        with pytest.raises(AuthenticationError, match=_AUTH_ERR_RE):
+            client.login()
+
+    def test_throws_when_no_set_cookie_header(self, login_mocks, login_response):
+        """Test that login raises AuthenticationError when no set-cookie header."""
+        # Redirect, but no set-cookie header
+        login_mocks.post.return_value = login_response(302, {})
+
+        client = StudentClient("code", "01/01/2000")
+        with pytest.raises(AuthenticationError, match=_AUTH_ERR_RE):
+            client.login()
@@ -0,0 +1,69 @@
+"""Tests for StudentClient login."""
+
+import json
+from urllib.parse import quote
+
+import responses
+
+from pyclasscharts.consts import API_BASE_STUDENT, BASE_URL
+from pyclasscharts.student_client import StudentClient
+
+LOGIN_URL = f"{BASE_URL}/student/login"
+PING_URL = f"{API_BASE_STUDENT}/ping"
+
+_SESSION_CREDENTIALS = json.dumps({"session_id": "test_session_id"})
+_SESSION_COOKIE = "student_session_credentials=" + _SESSION_CREDENTIALS
+_STUDENT_INFO = {"data": {"user": {"id": 456}}, "meta": {}, "success": 1}
+
+
+class TestStudentClientLogin:
+    """Test cases for StudentClient login."""
+
+    def test_login_success(self, http):
+        """Test successful login flow, from the Set-Cookie header to the first ping."""
+        http.add(
+            responses.POST,
+            LOGIN_URL,
+            status=302,
+            headers={
+                "Set-Cookie": f"student_session_credentials={quote(_SESSION_CREDENTIALS)}; path=/"
+            },
+        )
+        http.add(
+            responses.POST,
+            PING_URL,
+            json={**_STUDENT_INFO, "meta": {"session_id": "pinged_session_id"}},
+        )
+
+        client = StudentClient("ABC123", "01/01/2000")
+        client.login()
+
+        # The ping authenticates with the session ID decoded from the credentials cookie
+        assert http.calls[1].request.headers["Authorization"] == "Basic test_session_id"
+        assert client.session_id == "pinged_session_id"
+        assert client.student_id == 456
+
+    def test_student_code_stored_as_provided(self):
+        """Test that the student code is stored as provided."""
+        client = StudentClient("abc123", "01/01/2000")
+        assert client.student_code == "abc123"
+
+    def test_student_code_sent_uppercase(self, login_mocks, login_response):
+        """Test that student code is converted to uppercase during login."""
+        client = StudentClient("abc123", "01/01/2000")
+
+        # Mock successful login response
+        login_mocks.post.return_value = login_response(302, {"set-cookie": _SESSION_COOKIE})
+
+        # Mock get_new_session_id returning the ping response
+        login_mocks.get_new_session_id.return_value = _STUDENT_INFO
+
+        # requests stores the login response's cookies in the session's cookie jar
+        client._session.cookies.set("student_session_credentials", _SESSION_CREDENTIALS)
+        client.login()
+
+        # Verify the code was sent in uppercase
+        call_args = login_mocks.post.call_args
+        assert call_args is not None
+        form_data = call_args.kwargs["data"]
+        assert form_data["code"] == "ABC123"
@@ -34,3 +34,21 @@ class TestParseCookies:
         parsed = parse_cookies(cookie)
         assert "cookieWithNoValue" in parsed
         assert parsed["cookieWithNoValue"] == ""
+
+    def test_ignores_cookie_attributes(self):
+        """Test that attributes and Expires date fragments aren't parsed as cookies."""
+        cookies = (
+            "firstCookie=1; expires=Tue, 28-Nov-2023 10:28:45 GMT; Max-Age=7776000; path=/, "
+            "secondCookie=2; path=/"
+        )
+        assert parse_cookies(cookies) == {"firstCookie": "1", "secondCookie": "2"}
+
+    def test_decodes_only_encoded_names_and_values(self):
+        """Test that names and values are URL-decoded only when they contain escapes."""
+        parsed = parse_cookies("my%20cookie=a%2Bb; path=/, plain=a+b; path=/")
+        assert parsed == {"my cookie": "a+b", "plain": "a+b"}
+
+    def test_names_are_left_stripped_after_decoding(self):
+        """Test that only leading whitespace is removed from names, including encoded spaces."""
+        parsed = parse_cookies("%20encoded=1, trailing =2,  spaced=3")
+        assert parsed == {"encoded": "1", "trailing ": "2", "spaced": "3"}